@@ -1,10 +1,20 @@
+use rdkafka::admin::{AdminClient, AdminOptions, NewTopic, TopicReplication, TopicResult};
+use rdkafka::client::DefaultClientContext;
 use rdkafka::config::ClientConfig;
 use rdkafka::consumer::{Consumer, StreamConsumer};
+use rdkafka::error::KafkaError;
 use rdkafka::message::{BorrowedMessage, Message};
+use rdkafka::metadata::{Metadata, MetadataTopic};
 use rdkafka::producer::{FutureProducer, FutureRecord, Producer};
+use rdkafka::types::RDKafkaErrorCode;
 use rdkafka::util::Timeout;
 use serde::{Deserialize, Serialize};
-use std::time::Duration;
+use std::collections::hash_map::RandomState;
+use std::collections::{HashMap, HashSet};
+use std::fmt::Write;
+use std::hash::BuildHasher;
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::{Duration, Instant};
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct KafkaClientConfig {
@@ -22,8 +32,21 @@ pub struct KafkaClientConfig {
     pub enable_auto_commit: Option<bool>,
     /// SASL 认证配置
     pub sasl_config: Option<SaslConfig>,
+    /// Socket 接收缓冲区大小（字节），None 表示使用系统默认值
+    pub socket_receive_buffer_bytes: Option<u32>,
+    /// Socket 发送缓冲区大小（字节），None 表示使用系统默认值
+    pub socket_send_buffer_bytes: Option<u32>,
 }
 
+/// SASL PLAIN 机制
+pub const SASL_PLAIN: &str = "PLAIN";
+/// SASL SCRAM-SHA-256 机制
+pub const SASL_SCRAM_SHA_256: &str = "SCRAM-SHA-256";
+/// SASL SCRAM-SHA-512 机制
+pub const SASL_SCRAM_SHA_512: &str = "SCRAM-SHA-512";
+/// 支持的 SASL 机制
+pub const SASL_MECHANISMS: [&str; 3] = [SASL_PLAIN, SASL_SCRAM_SHA_256, SASL_SCRAM_SHA_512];
+
 /// SASL 认证配置
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct SaslConfig {
@@ -41,7 +64,7 @@ impl SaslConfig {
     /// 创建 SASL PLAINTEXT 配置
     pub fn plaintext(username: impl Into<String>, password: impl Into<String>) -> Self {
         Self {
-            mechanism: "PLAIN".to_string(),
+            mechanism: SASL_PLAIN.to_string(),
             username: username.into(),
             password: password.into(),
             security_protocol: "SASL_PLAINTEXT".to_string(),
@@ -51,18 +74,55 @@ impl SaslConfig {
     /// 创建 SASL SSL 配置
     pub fn ssl(username: impl Into<String>, password: impl Into<String>) -> Self {
         Self {
-            mechanism: "PLAIN".to_string(),
+            mechanism: SASL_PLAIN.to_string(),
             username: username.into(),
             password: password.into(),
             security_protocol: "SASL_SSL".to_string(),
         }
     }
 
+    /// 由可选的用户名与密码构建 SASL 配置，命令行与 HTTP API 共用
+    ///
+    /// 缺少用户名或密码、机制不受支持时返回错误
+    pub fn from_credentials(
+        mechanism: &str,
+        username: Option<String>,
+        password: Option<String>,
+        security_protocol: impl Into<String>,
+    ) -> Result<Self, String> {
+        let (Some(username), Some(password)) = (username, password) else {
+            return Err("Username and password are required when SASL is enabled".to_string());
+        };
+
+        Ok(Self {
+            mechanism: Self::normalize_mechanism(mechanism)?.to_string(),
+            username,
+            password,
+            security_protocol: security_protocol.into(),
+        })
+    }
+
     /// 设置 SASL 机制
     pub fn with_mechanism(mut self, mechanism: impl Into<String>) -> Self {
         self.mechanism = mechanism.into();
         self
     }
+
+    /// 校验并规范化 SASL 机制名称，忽略大小写
+    ///
+    /// 在建连前拒绝不支持的机制，避免等到 SASL 握手失败才发现拼写错误
+    pub fn normalize_mechanism(mechanism: &str) -> Result<&'static str, String> {
+        SASL_MECHANISMS
+            .iter()
+            .find(|supported| supported.eq_ignore_ascii_case(mechanism.trim()))
+            .copied()
+            .ok_or_else(|| {
+                format!(
+                    "Unsupported SASL mechanism: {mechanism} (expected one of {})",
+                    SASL_MECHANISMS.join(", ")
+                )
+            })
+    }
 }
 
 impl KafkaClientConfig {
@@ -76,6 +136,8 @@ impl KafkaClientConfig {
             session_timeout_ms: Some(6000),
             enable_auto_commit: Some(true),
             sasl_config: None,
+            socket_receive_buffer_bytes: None,
+            socket_send_buffer_bytes: None,
         }
     }
 
@@ -119,11 +181,57 @@ impl KafkaClientConfig {
         self
     }
 
+    /// 设置 socket 接收与发送缓冲区大小（字节）
+    ///
+    /// 大集群的全量 metadata 响应可达数 MB，调大接收缓冲区可减少 recv 系统调用次数。
+    /// 显式设置会关闭 Linux 的缓冲区自动调节，且实际大小受 rmem_max/wmem_max 限制，
+    /// 未设置时使用系统默认值
+    pub fn with_socket_buffers(mut self, receive_bytes: u32, send_bytes: u32) -> Self {
+        self.socket_receive_buffer_bytes = Some(receive_bytes);
+        self.socket_send_buffer_bytes = Some(send_bytes);
+        self
+    }
+
     /// 获取 broker 地址字符串
     fn broker_string(&self) -> String {
         self.brokers.join(",")
     }
 
+    /// 共享客户端缓存的键
+    ///
+    /// 使用完整配置的序列化结果，保证只有配置完全一致的调用才会复用同一客户端；
+    /// SASL 密码只以进程内随机种子的哈希值参与，缓存中不保留明文密码
+    fn shared_key(&self) -> Result<String, String> {
+        let mut key = self.clone();
+        if let Some(sasl) = &mut key.sasl_config {
+            sasl.password = format!("{:016x}", password_hasher().hash_one(&sasl.password));
+        }
+        serde_json::to_string(&key).map_err(|e| format!("Failed to serialize Kafka config: {e}"))
+    }
+
+    /// 构建各类客户端共用的基础 ClientConfig
+    fn base_client_config(&self) -> ClientConfig {
+        let mut client_config = ClientConfig::new();
+        client_config
+            .set("bootstrap.servers", self.broker_string())
+            .set("client.id", &self.client_id);
+
+        if let Some(timeout) = self.timeout {
+            client_config.set("socket.timeout.ms", (timeout * 1000).to_string());
+        }
+        if let Some(bytes) = self.socket_receive_buffer_bytes {
+            client_config.set("socket.receive.buffer.bytes", bytes.to_string());
+        }
+        if let Some(bytes) = self.socket_send_buffer_bytes {
+            client_config.set("socket.send.buffer.bytes", bytes.to_string());
+        }
+
+        // 应用 SASL 认证配置
+        self.apply_sasl_config(&mut client_config);
+
+        client_config
+    }
+
     /// 应用 SASL 配置到 ClientConfig
     fn apply_sasl_config(&self, client_config: &mut ClientConfig) {
         if let Some(sasl) = &self.sasl_config {
@@ -136,6 +244,144 @@ impl KafkaClientConfig {
     }
 }
 
+/// Topic metadata 摘要
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+pub struct TopicMetadataInfo {
+    /// Topic 名称
+    pub name: String,
+    /// 分区数量
+    pub partitions: usize,
+}
+
+impl From<&MetadataTopic> for TopicMetadataInfo {
+    fn from(topic: &MetadataTopic) -> Self {
+        Self {
+            name: topic.name().to_string(),
+            partitions: topic.partitions().len(),
+        }
+    }
+}
+
+/// 集群 metadata 摘要
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+pub struct ClusterMetadataInfo {
+    /// 返回本次 metadata 的 broker 名称
+    pub orig_broker_name: String,
+    /// Broker 数量
+    pub broker_count: usize,
+    /// 本次响应中有效 topic 的数量
+    pub topic_count: usize,
+    /// 调用方请求的 topic（不含获取失败或不存在的 topic）
+    pub topics: Vec<TopicMetadataInfo>,
+}
+
+impl ClusterMetadataInfo {
+    /// 从 metadata 构建摘要，只为请求的 topic 分配名称，其余 topic 仅计数
+    fn from_metadata(metadata: &Metadata, wanted: &HashSet<&str>) -> Self {
+        let mut topic_count = 0;
+        let mut topics = Vec::with_capacity(wanted.len());
+        for topic in metadata.topics() {
+            if topic.error().is_some() {
+                continue;
+            }
+            topic_count += 1;
+            if wanted.contains(topic.name()) {
+                topics.push(TopicMetadataInfo::from(topic));
+            }
+        }
+
+        Self {
+            orig_broker_name: metadata.orig_broker_name().to_string(),
+            broker_count: metadata.brokers().len(),
+            topic_count,
+            topics,
+        }
+    }
+}
+
+/// 单个 broker 的 TCP 连通性探测结果
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+pub struct BrokerProbe {
+    /// Broker 地址（host:port）
+    pub broker: String,
+    /// 是否可以建立 TCP 连接
+    pub reachable: bool,
+    /// 建立连接耗时（毫秒）
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub latency_ms: Option<u64>,
+    /// 连接失败原因
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub error: Option<String>,
+}
+
+/// 并发探测所有 broker 的 TCP 连通性，结果顺序与传入的 broker 顺序一致
+///
+/// 各探测同时进行，总耗时取最慢的一个而不是逐个累加
+pub async fn probe_brokers(brokers: &[String], timeout: Duration) -> Vec<BrokerProbe> {
+    futures::future::join_all(brokers.iter().map(|broker| probe_broker(broker, timeout))).await
+}
+
+/// 未指定端口时使用的 Kafka 默认端口
+const DEFAULT_KAFKA_PORT: u16 = 9092;
+
+/// 将 broker 地址转换为可直接连接的 host:port
+///
+/// 与 librdkafka 的 bootstrap.servers 保持一致：去掉可选的 `协议://` 前缀（如
+/// `SASL_SSL://host:9092`），未指定端口时使用默认端口 9092
+fn broker_address(broker: &str) -> String {
+    let address = broker
+        .split_once("://")
+        .map_or(broker, |(_, rest)| rest)
+        .trim_end_matches('/');
+    let has_port = address.rsplit_once(':').is_some_and(|(host, port)| {
+        !port.is_empty()
+            && port.bytes().all(|b| b.is_ascii_digit())
+            && (!host.contains(':') || host.ends_with(']'))
+    });
+
+    if has_port {
+        address.to_string()
+    } else {
+        format!("{address}:{DEFAULT_KAFKA_PORT}")
+    }
+}
+
+/// 探测单个 broker 的 TCP 连通性
+async fn probe_broker(broker: &str, timeout: Duration) -> BrokerProbe {
+    let address = broker_address(broker);
+    let start = Instant::now();
+    let connect = tokio::net::TcpStream::connect(address.as_str());
+    let error = match tokio::time::timeout(timeout, connect).await {
+        Ok(Ok(_)) => None,
+        Ok(Err(e)) => Some(e.to_string()),
+        Err(_) => Some(format!("connect timed out after {}s", timeout.as_secs())),
+    };
+
+    BrokerProbe {
+        broker: broker.to_string(),
+        reachable: error.is_none(),
+        latency_ms: error.is_none().then(|| start.elapsed().as_millis() as u64),
+        error,
+    }
+}
+
+/// 共享生产者缓存的最大条目数
+///
+/// 超出后先清理未被使用的条目，仍然已满时新客户端不再放入缓存
+const MAX_SHARED_PRODUCERS: usize = 32;
+
+/// 生成共享缓存键中密码哈希的进程内随机种子
+fn password_hasher() -> &'static RandomState {
+    static INSTANCE: OnceLock<RandomState> = OnceLock::new();
+    INSTANCE.get_or_init(RandomState::new)
+}
+
+/// 进程内共享的生产者缓存
+fn shared_producers() -> &'static Mutex<HashMap<String, Arc<KafkaProducer>>> {
+    static INSTANCE: OnceLock<Mutex<HashMap<String, Arc<KafkaProducer>>>> = OnceLock::new();
+    INSTANCE.get_or_init(|| Mutex::new(HashMap::new()))
+}
+
 /// Kafka 生产者客户端
 pub struct KafkaProducer {
     producer: FutureProducer,
@@ -144,29 +390,54 @@ pub struct KafkaProducer {
 impl KafkaProducer {
     /// 创建一个新的 Kafka 生产者
     pub fn new(config: &KafkaClientConfig) -> Result<Self, String> {
-        let mut client_config = ClientConfig::new();
+        let mut client_config = config.base_client_config();
         client_config
-            .set("bootstrap.servers", config.broker_string())
-            .set("client.id", &config.client_id)
             .set("message.timeout.ms", "5000")
             .set("queue.buffering.max.messages", "100000")
             .set("queue.buffering.max.kbytes", "1048576")
             .set("batch.num.messages", "10000");
 
-        if let Some(timeout) = config.timeout {
-            client_config.set("socket.timeout.ms", (timeout * 1000).to_string());
-        }
-
-        // 应用 SASL 认证配置
-        config.apply_sasl_config(&mut client_config);
-
         let producer = client_config
             .create()
-            .map_err(|e| format!("Failed to create Kafka producer: {e}"))?;
+            .map_err(|e| describe_kafka_error("Failed to create Kafka producer", &e))?;
 
         Ok(Self { producer })
     }
 
+    /// 获取进程内共享的 Kafka 生产者
+    ///
+    /// 相同配置的多次调用复用同一个底层客户端，只在首次调用时建立连接、完成 SASL 握手
+    /// 并拉取 metadata，后续调用直接复用已建立的 broker 连接。缓存条目数有上限，
+    /// 请求失败的客户端应通过 [`KafkaProducer::evict_shared`] 移出缓存
+    pub fn get_shared(config: &KafkaClientConfig) -> Result<Arc<Self>, String> {
+        let key = config.shared_key()?;
+        let mut producers = shared_producers()
+            .lock()
+            .map_err(|_| "Shared Kafka producer cache poisoned".to_string())?;
+
+        if let Some(producer) = producers.get(&key) {
+            return Ok(Arc::clone(producer));
+        }
+
+        let producer = Arc::new(Self::new(config)?);
+        if producers.len() >= MAX_SHARED_PRODUCERS {
+            producers.retain(|_, cached| Arc::strong_count(cached) > 1);
+        }
+        if producers.len() < MAX_SHARED_PRODUCERS {
+            producers.insert(key, Arc::clone(&producer));
+        }
+        Ok(producer)
+    }
+
+    /// 将指定配置的共享生产者移出缓存
+    ///
+    /// 用于 broker 不可达、认证失败等请求失败的场景，避免失效的客户端及其重连线程常驻进程
+    pub fn evict_shared(config: &KafkaClientConfig) {
+        if let (Ok(key), Ok(mut producers)) = (config.shared_key(), shared_producers().lock()) {
+            producers.remove(&key);
+        }
+    }
+
     /// 发送消息到指定的 topic
     pub async fn send(&self, topic: &str, key: Option<&str>, payload: &[u8]) -> Result<(), String> {
         let mut record = FutureRecord::to(topic).payload(payload);
@@ -178,7 +449,7 @@ impl KafkaProducer {
         self.producer
             .send(record, Timeout::After(Duration::from_secs(5)))
             .await
-            .map_err(|(e, _)| format!("Failed to send message: {e}"))?;
+            .map_err(|(e, _)| describe_kafka_error("Failed to send message", &e))?;
 
         Ok(())
     }
@@ -199,7 +470,7 @@ impl KafkaProducer {
     pub fn flush(&self, timeout: Duration) -> Result<(), String> {
         self.producer
             .flush(Timeout::After(timeout))
-            .map_err(|e| format!("Failed to flush producer: {e}"))?;
+            .map_err(|e| describe_kafka_error("Failed to flush producer", &e))?;
         Ok(())
     }
 
@@ -210,23 +481,59 @@ impl KafkaProducer {
         self.producer
             .client()
             .fetch_metadata(None, Timeout::After(timeout))
-            .map_err(|e| format!("Ping failed: {e}"))?;
+            .map_err(|e| describe_kafka_error("Ping failed", &e))?;
         Ok(())
     }
 
+    /// 获取集群 metadata 摘要及指定 topic 的信息
+    ///
+    /// 只指定一个 topic 时只请求该 topic 的 metadata，broker 列表照常返回，可作为大集群上的
+    /// 轻量健康检查；否则发起一次全量请求并在本地过滤。未请求的 topic 只计数不复制名称
+    pub fn describe_cluster(
+        &self,
+        topics: &[&str],
+        timeout: Duration,
+    ) -> Result<ClusterMetadataInfo, String> {
+        let target = match topics {
+            [topic] => Some(*topic),
+            _ => None,
+        };
+        let metadata = self
+            .producer
+            .client()
+            .fetch_metadata(target, Timeout::After(timeout))
+            .map_err(|e| describe_kafka_error("Failed to fetch metadata", &e))?;
+
+        let wanted: HashSet<&str> = topics.iter().copied().collect();
+        Ok(ClusterMetadataInfo::from_metadata(&metadata, &wanted))
+    }
+
     /// 获取指定 topic 的 metadata
     pub fn get_topic_metadata(&self, topic: &str, timeout: Duration) -> Result<String, String> {
         let metadata = self
             .producer
             .client()
             .fetch_metadata(Some(topic), Timeout::After(timeout))
-            .map_err(|e| format!("Failed to fetch metadata: {e}"))?;
+            .map_err(|e| describe_kafka_error("Failed to fetch metadata", &e))?;
 
-        let mut result = format!("Cluster: {}\n", metadata.orig_broker_name());
-        result.push_str(&format!("Brokers: {}\n", metadata.brokers().len()));
-        result.push_str(&format!("Topics: {}\n", metadata.topics().len()));
+        Ok(format_metadata_summary(&metadata, topic))
+    }
 
-        Ok(result)
+    /// 列出集群中所有 topic 及其分区数量
+    ///
+    /// 一次 metadata 请求同时返回 topic 名称与分区信息
+    pub fn list_topics(&self, timeout: Duration) -> Result<Vec<TopicMetadataInfo>, String> {
+        let metadata = self
+            .producer
+            .client()
+            .fetch_metadata(None, Timeout::After(timeout))
+            .map_err(|e| describe_kafka_error("Failed to fetch metadata", &e))?;
+
+        Ok(metadata
+            .topics()
+            .iter()
+            .map(TopicMetadataInfo::from)
+            .collect())
     }
 }
 
@@ -243,10 +550,8 @@ impl KafkaConsumer {
             .as_ref()
             .ok_or_else(|| "Group ID is required for consumer".to_string())?;
 
-        let mut client_config = ClientConfig::new();
+        let mut client_config = config.base_client_config();
         client_config
-            .set("bootstrap.servers", config.broker_string())
-            .set("client.id", &config.client_id)
             .set("group.id", group_id)
             .set(
                 "enable.auto.commit",
@@ -259,16 +564,9 @@ impl KafkaConsumer {
             .set("enable.partition.eof", "false")
             .set("auto.offset.reset", "earliest");
 
-        if let Some(timeout) = config.timeout {
-            client_config.set("socket.timeout.ms", (timeout * 1000).to_string());
-        }
-
-        // 应用 SASL 认证配置
-        config.apply_sasl_config(&mut client_config);
-
         let consumer: StreamConsumer = client_config
             .create()
-            .map_err(|e| format!("Failed to create Kafka consumer: {e}"))?;
+            .map_err(|e| describe_kafka_error("Failed to create Kafka consumer", &e))?;
 
         Ok(Self { consumer })
     }
@@ -277,7 +575,7 @@ impl KafkaConsumer {
     pub fn subscribe(&self, topics: &[&str]) -> Result<(), String> {
         self.consumer
             .subscribe(topics)
-            .map_err(|e| format!("Failed to subscribe to topics: {e}"))?;
+            .map_err(|e| describe_kafka_error("Failed to subscribe to topics", &e))?;
         Ok(())
     }
 
@@ -286,14 +584,14 @@ impl KafkaConsumer {
         self.consumer
             .recv()
             .await
-            .map_err(|e| format!("Failed to receive message: {e}"))
+            .map_err(|e| describe_kafka_error("Failed to receive message", &e))
     }
 
     /// 提交当前偏移量
     pub fn commit(&self) -> Result<(), String> {
         self.consumer
             .commit_consumer_state(rdkafka::consumer::CommitMode::Sync)
-            .map_err(|e| format!("Failed to commit offset: {e}"))?;
+            .map_err(|e| describe_kafka_error("Failed to commit offset", &e))?;
         Ok(())
     }
 
@@ -308,7 +606,7 @@ impl KafkaConsumer {
     pub fn ping(&self, timeout: Duration) -> Result<(), String> {
         self.consumer
             .fetch_metadata(None, Timeout::After(timeout))
-            .map_err(|e| format!("Ping failed: {e}"))?;
+            .map_err(|e| describe_kafka_error("Ping failed", &e))?;
         Ok(())
     }
 
@@ -317,26 +615,195 @@ impl KafkaConsumer {
         let metadata = self
             .consumer
             .fetch_metadata(Some(topic), Timeout::After(timeout))
-            .map_err(|e| format!("Failed to fetch metadata: {e}"))?;
-
-        let mut result = format!("Cluster: {}\n", metadata.orig_broker_name());
-        result.push_str(&format!("Brokers: {}\n", metadata.brokers().len()));
-        result.push_str(&format!("Topics: {}\n", metadata.topics().len()));
-
-        for topic_meta in metadata.topics() {
-            if topic_meta.name() == topic {
-                result.push_str(&format!(
-                    "  Topic '{}': {} partitions\n",
-                    topic_meta.name(),
-                    topic_meta.partitions().len()
-                ));
-            }
+            .map_err(|e| describe_kafka_error("Failed to fetch metadata", &e))?;
+
+        Ok(format_metadata_summary(&metadata, topic))
+    }
+}
+
+/// 待创建 topic 的规格
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+pub struct TopicSpec {
+    /// Topic 名称
+    pub name: String,
+    /// 分区数量
+    pub partitions: i32,
+    /// 副本因子
+    pub replication_factor: i32,
+}
+
+impl TopicSpec {
+    /// 创建一个新的 topic 规格
+    pub fn new(name: impl Into<String>, partitions: i32, replication_factor: i32) -> Self {
+        Self {
+            name: name.into(),
+            partitions,
+            replication_factor,
+        }
+    }
+}
+
+/// 单个 topic 管理操作的结果
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+pub struct TopicOperationResult {
+    /// Topic 名称
+    pub name: String,
+    /// 是否成功
+    pub success: bool,
+    /// 失败原因
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub error: Option<String>,
+}
+
+impl From<TopicResult> for TopicOperationResult {
+    fn from(result: TopicResult) -> Self {
+        match result {
+            Ok(name) => Self {
+                name,
+                success: true,
+                error: None,
+            },
+            Err((name, code)) => Self {
+                name,
+                success: false,
+                error: Some(code.to_string()),
+            },
         }
+    }
+}
+
+/// Kafka 管理客户端
+///
+/// 批量操作在一次请求中提交全部 topic，由 broker 逐个返回结果
+pub struct KafkaAdmin {
+    admin: AdminClient<DefaultClientContext>,
+    timeout: Duration,
+}
+
+impl KafkaAdmin {
+    /// 创建一个新的 Kafka 管理客户端
+    pub fn new(config: &KafkaClientConfig) -> Result<Self, String> {
+        let admin = config
+            .base_client_config()
+            .create()
+            .map_err(|e| describe_kafka_error("Failed to create Kafka admin client", &e))?;
+
+        Ok(Self {
+            admin,
+            timeout: Duration::from_secs(config.timeout.unwrap_or(30)),
+        })
+    }
+
+    /// 管理请求选项
+    fn options(&self) -> AdminOptions {
+        AdminOptions::new()
+            .request_timeout(Some(self.timeout))
+            .operation_timeout(Some(self.timeout))
+    }
+
+    /// 一次请求批量创建 topic
+    ///
+    /// 返回每个 topic 各自的结果，已存在等单个 topic 的失败不会影响其他 topic
+    pub async fn create_topics(
+        &self,
+        specs: &[TopicSpec],
+    ) -> Result<Vec<TopicOperationResult>, String> {
+        let new_topics: Vec<NewTopic<'_>> = specs
+            .iter()
+            .map(|spec| {
+                NewTopic::new(
+                    &spec.name,
+                    spec.partitions,
+                    TopicReplication::Fixed(spec.replication_factor),
+                )
+            })
+            .collect();
+
+        let results = self
+            .admin
+            .create_topics(&new_topics, &self.options())
+            .await
+            .map_err(|e| describe_kafka_error("Failed to create topics", &e))?;
+
+        Ok(results
+            .into_iter()
+            .map(TopicOperationResult::from)
+            .collect())
+    }
+
+    /// 一次请求批量删除 topic
+    pub async fn delete_topics(&self, names: &[&str]) -> Result<Vec<TopicOperationResult>, String> {
+        let results = self
+            .admin
+            .delete_topics(names, &self.options())
+            .await
+            .map_err(|e| describe_kafka_error("Failed to delete topics", &e))?;
 
-        Ok(result)
+        Ok(results
+            .into_iter()
+            .map(TopicOperationResult::from)
+            .collect())
     }
 }
 
+/// 辅助函数：将 Kafka 错误格式化为错误信息
+///
+/// 连接、解析类错误追加 broker 不可达的提示，超时类错误追加较弱的提示（broker 可能可达但响应慢），
+/// 便于与认证、权限等 broker 端错误区分
+fn describe_kafka_error(context: &str, e: &KafkaError) -> String {
+    match e.rdkafka_error_code() {
+        Some(code) if is_unreachable_code(code) => format!(
+            "{context}: {e} (broker unreachable, check broker addresses, ports and network access)"
+        ),
+        Some(code) if is_timeout_code(code) => format!(
+            "{context}: {e} (request timed out, the broker may be slow or overloaded, try a larger timeout)"
+        ),
+        _ => format!("{context}: {e}"),
+    }
+}
+
+/// 是否为 broker 不可达类的错误码
+fn is_unreachable_code(code: RDKafkaErrorCode) -> bool {
+    matches!(
+        code,
+        RDKafkaErrorCode::BrokerTransportFailure
+            | RDKafkaErrorCode::AllBrokersDown
+            | RDKafkaErrorCode::Resolve
+            | RDKafkaErrorCode::NetworkException
+    )
+}
+
+/// 是否为超时类的错误码
+fn is_timeout_code(code: RDKafkaErrorCode) -> bool {
+    matches!(
+        code,
+        RDKafkaErrorCode::OperationTimedOut | RDKafkaErrorCode::RequestTimedOut
+    )
+}
+
+/// 辅助函数：将 metadata 格式化为摘要文本
+///
+/// 直接写入同一个 String，避免每行单独 format! 产生临时分配
+fn format_metadata_summary(metadata: &Metadata, topic: &str) -> String {
+    let mut result = String::with_capacity(128);
+    let _ = writeln!(result, "Cluster: {}", metadata.orig_broker_name());
+    let _ = writeln!(result, "Brokers: {}", metadata.brokers().len());
+    let _ = writeln!(result, "Topics: {}", metadata.topics().len());
+
+    for topic_meta in metadata.topics() {
+        if topic_meta.name() == topic {
+            let _ = writeln!(
+                result,
+                "  Topic '{}': {} partitions",
+                topic_meta.name(),
+                topic_meta.partitions().len()
+            );
+        }
+    }
+
+    result
+}
+
 /// 辅助函数：从消息中提取 payload
 pub fn extract_payload<'a>(msg: &'a BorrowedMessage<'a>) -> Option<&'a [u8]> {
     msg.payload()
@@ -388,4 +855,150 @@ mod tests {
         assert_eq!(sasl.username, "user");
         assert_eq!(sasl.password, "pass");
     }
+
+    #[test]
+    fn test_normalize_sasl_mechanism() {
+        assert_eq!(
+            SaslConfig::normalize_mechanism("scram-sha-256"),
+            Ok(SASL_SCRAM_SHA_256)
+        );
+        assert!(SaslConfig::normalize_mechanism("GSSAPI").is_err());
+    }
+
+    #[test]
+    fn test_sasl_from_credentials() {
+        let sasl = SaslConfig::from_credentials(
+            "scram-sha-512",
+            Some("user".to_string()),
+            Some("pass".to_string()),
+            "SASL_SSL",
+        )
+        .unwrap();
+        assert_eq!(sasl.mechanism, SASL_SCRAM_SHA_512);
+        assert_eq!(sasl.security_protocol, "SASL_SSL");
+
+        assert!(
+            SaslConfig::from_credentials("PLAIN", Some("user".to_string()), None, "SASL_PLAINTEXT")
+                .is_err()
+        );
+    }
+
+    #[test]
+    fn test_config_with_socket_buffers() {
+        let config = KafkaClientConfig::new(vec!["localhost:9092".to_string()], "test-client")
+            .with_socket_buffers(1 << 20, 1 << 18);
+        let client_config = config.base_client_config();
+
+        assert_eq!(
+            client_config.get("socket.receive.buffer.bytes"),
+            Some("1048576")
+        );
+        assert_eq!(
+            client_config.get("socket.send.buffer.bytes"),
+            Some("262144")
+        );
+    }
+
+    #[test]
+    fn test_describe_kafka_error_hints_unreachable_broker() {
+        let unreachable = describe_kafka_error(
+            "Ping failed",
+            &KafkaError::MetadataFetch(RDKafkaErrorCode::AllBrokersDown),
+        );
+        assert!(unreachable.starts_with("Ping failed: "));
+        assert!(unreachable.contains("broker unreachable"));
+
+        let auth = describe_kafka_error(
+            "Ping failed",
+            &KafkaError::MetadataFetch(RDKafkaErrorCode::SaslAuthenticationFailed),
+        );
+        assert!(!auth.contains("broker unreachable"));
+
+        let timeout = describe_kafka_error(
+            "Failed to flush producer",
+            &KafkaError::Flush(RDKafkaErrorCode::OperationTimedOut),
+        );
+        assert!(!timeout.contains("broker unreachable"));
+        assert!(timeout.contains("timed out"));
+    }
+
+    #[test]
+    fn test_topic_operation_result_from_topic_result() {
+        let ok = TopicOperationResult::from(Ok("created".to_string()));
+        assert!(ok.success);
+        assert_eq!(ok.name, "created");
+        assert_eq!(ok.error, None);
+
+        let err = TopicOperationResult::from(Err((
+            "existing".to_string(),
+            rdkafka::types::RDKafkaErrorCode::TopicAlreadyExists,
+        )));
+        assert!(!err.success);
+        assert_eq!(err.name, "existing");
+        assert!(err.error.is_some());
+    }
+
+    #[test]
+    fn test_get_shared_reuses_producer() {
+        let config = KafkaClientConfig::new(vec!["localhost:9092".to_string()], "shared-client")
+            .with_sasl_plaintext(USERNAME, PASSWORD);
+        let other = config.clone().with_sasl_plaintext("user2", PASSWORD);
+
+        let first = KafkaProducer::get_shared(&config).expect("Failed to create producer");
+        let second = KafkaProducer::get_shared(&config).expect("Failed to create producer");
+        let third = KafkaProducer::get_shared(&other).expect("Failed to create producer");
+
+        assert!(Arc::ptr_eq(&first, &second));
+        assert!(!Arc::ptr_eq(&first, &third));
+
+        KafkaProducer::evict_shared(&config);
+        let fourth = KafkaProducer::get_shared(&config).expect("Failed to create producer");
+        assert!(!Arc::ptr_eq(&first, &fourth));
+    }
+
+    #[test]
+    fn test_shared_key_hides_password() {
+        let config = KafkaClientConfig::new(vec!["localhost:9092".to_string()], "test-client")
+            .with_sasl_plaintext(USERNAME, "secret-password");
+        let other = config
+            .clone()
+            .with_sasl_plaintext(USERNAME, "other-password");
+
+        let key = config.shared_key().unwrap();
+        assert!(!key.contains("secret-password"));
+        assert_eq!(key, config.shared_key().unwrap());
+        assert_ne!(key, other.shared_key().unwrap());
+    }
+
+    #[test]
+    fn test_broker_address() {
+        assert_eq!(broker_address("localhost:9093"), "localhost:9093");
+        assert_eq!(broker_address("SASL_SSL://kafka-1:9094"), "kafka-1:9094");
+        assert_eq!(broker_address("kafka-1"), "kafka-1:9092");
+        assert_eq!(broker_address("PLAINTEXT://kafka-1/"), "kafka-1:9092");
+        assert_eq!(broker_address("[::1]:9093"), "[::1]:9093");
+        assert_eq!(broker_address("[::1]"), "[::1]:9092");
+    }
+
+    #[tokio::test]
+    async fn test_probe_brokers() {
+        let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+        let open = format!("PLAINTEXT://{}", listener.local_addr().unwrap());
+        let closed = {
+            let listener = tokio::net::TcpListener::bind("127.0.0.1:0").await.unwrap();
+            listener.local_addr().unwrap().to_string()
+        };
+
+        let probes = probe_brokers(&[open.clone(), closed.clone()], Duration::from_secs(2)).await;
+
+        assert_eq!(probes[0].broker, open);
+        assert!(probes[0].reachable);
+        assert!(probes[0].latency_ms.is_some());
+        assert_eq!(probes[0].error, None);
+
+        assert_eq!(probes[1].broker, closed);
+        assert!(!probes[1].reachable);
+        assert_eq!(probes[1].latency_ms, None);
+        assert!(probes[1].error.is_some());
+    }
 }
@@ -1,5 +1,7 @@
 use std::io::{self, Read, Write};
-use std::net::{TcpStream, ToSocketAddrs};
+use std::net::{SocketAddr, TcpStream, ToSocketAddrs};
+use std::sync::mpsc;
+use std::thread;
 use std::time::Duration;
 
 /// 发起 TCP 请求服务端
@@ -15,7 +17,8 @@ pub struct DialTcpRequest {
     pub read_timeout: Option<u64>,
     /// 写入超时时间（秒），None 表示无超时
     pub write_timeout: Option<u64>,
-    /// 是否启用 TCP_NODELAY (禁用 Nagle 算法)
+    /// 是否启用 TCP_NODELAY (禁用 Nagle 算法)，默认启用，
+    /// 探测类的一问一答请求不必等待 Nagle 合并小包
     pub nodelay: bool,
 }
 
@@ -28,7 +31,7 @@ impl DialTcpRequest {
             timeout: Some(30),
             read_timeout: Some(30),
             write_timeout: Some(30),
-            nodelay: false,
+            nodelay: true,
         }
     }
 
@@ -75,7 +78,7 @@ impl DialTcpRequest {
                     "could not resolve to any addresses",
                 ));
             }
-            TcpStream::connect_timeout(&addrs[0], Duration::from_secs(timeout))?
+            connect_any(&addrs, Duration::from_secs(timeout))?
         } else {
             // 不使用超时
             TcpStream::connect(&addr)?
@@ -128,6 +131,61 @@ impl DialTcpRequest {
     }
 }
 
+/// 同时发起连接的最大地址数
+const MAX_CONCURRENT_CONNECTS: usize = 4;
+
+/// 并发连接解析到的地址（IPv4/IPv6），返回最先建立成功的连接
+///
+/// 双栈环境下某个地址族不可达时不必等满超时再尝试下一个地址。地址按解析顺序分批，
+/// 每批最多同时连接 `MAX_CONCURRENT_CONNECTS` 个，整批失败后再尝试下一批。
+/// 返回后落败的连接不会被中断：各自的线程在连接完成或超时后才退出，
+/// 届时建立的多余连接随即关闭
+fn connect_any(addrs: &[SocketAddr], timeout: Duration) -> io::Result<TcpStream> {
+    let mut last_err = None;
+    for batch in addrs.chunks(MAX_CONCURRENT_CONNECTS) {
+        match connect_batch(batch, timeout) {
+            Ok(stream) => return Ok(stream),
+            Err(e) => last_err = Some(e),
+        }
+    }
+
+    Err(last_err.unwrap_or_else(no_addresses))
+}
+
+/// 同时连接一批地址，每个地址一个线程，返回最先建立成功的连接或最后一个错误
+fn connect_batch(addrs: &[SocketAddr], timeout: Duration) -> io::Result<TcpStream> {
+    if let [addr] = addrs {
+        return TcpStream::connect_timeout(addr, timeout);
+    }
+
+    let (tx, rx) = mpsc::channel();
+    for addr in addrs.iter().copied() {
+        let tx = tx.clone();
+        thread::spawn(move || {
+            let _ = tx.send(TcpStream::connect_timeout(&addr, timeout));
+        });
+    }
+    drop(tx);
+
+    let mut last_err = None;
+    for result in rx {
+        match result {
+            Ok(stream) => return Ok(stream),
+            Err(e) => last_err = Some(e),
+        }
+    }
+
+    Err(last_err.unwrap_or_else(no_addresses))
+}
+
+/// 没有可连接地址时返回的错误
+fn no_addresses() -> io::Error {
+    io::Error::new(
+        io::ErrorKind::InvalidInput,
+        "could not resolve to any addresses",
+    )
+}
+
 impl Default for DialTcpRequest {
     fn default() -> Self {
         Self::new("127.0.0.1", 8080)
@@ -57,6 +57,17 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_dial_resolves_all_addresses() {
+        let listener = std::net::TcpListener::bind("127.0.0.1:0").expect("bind listener");
+        let port = listener.local_addr().expect("local addr").port();
+
+        let request = DialTcpRequest::new("localhost", port).with_timeout(5);
+        let stream = request.dial().expect("dial localhost");
+
+        assert_eq!(stream.peer_addr().expect("peer addr").port(), port);
+    }
+
     #[test]
     fn test_socket_addr() {
         let request = DialTcpRequest::new("example.com", 443);
@@ -68,6 +79,7 @@ mod tests {
         let request = DialTcpRequest::default();
         assert_eq!(request.addr, "127.0.0.1");
         assert_eq!(request.port, 8080);
+        assert!(request.nodelay);
     }
 
     #[test]
@@ -84,5 +96,6 @@ mod tests {
         assert_eq!(request.read_timeout, Some(15));
         assert_eq!(request.write_timeout, Some(15));
         assert_eq!(request.nodelay, true);
+        assert!(!request.with_nodelay(false).nodelay);
     }
 }
@@ -7,7 +7,9 @@ use axum::{
 use serde::{Deserialize, Serialize};
 use std::time::Duration;
 use tracing::{error, info};
-use util::client::kafka::{KafkaClientConfig, KafkaProducer, SaslConfig};
+use util::client::kafka::{
+    BrokerProbe, KafkaClientConfig, KafkaProducer, SaslConfig, probe_brokers,
+};
 
 #[derive(Debug, Serialize, Deserialize)]
 pub struct PingRequest {
@@ -68,6 +70,8 @@ pub struct PingResponse {
     pub topic: Option<String>,
     #[serde(skip_serializing_if = "Option::is_none")]
     pub partition_count: Option<usize>,
+    #[serde(default, skip_serializing_if = "Vec::is_empty")]
+    pub broker_probes: Vec<BrokerProbe>,
     #[serde(skip_serializing_if = "Option::is_none")]
     pub error: Option<String>,
 }
@@ -109,34 +113,33 @@ async fn ping_kafka(
         topic_count: None,
         topic: req.topic.clone(),
         partition_count: None,
+        broker_probes: Vec::new(),
         error: None,
     };
 
     // SASL 配置
     if req.sasl {
-        if req.username.is_none() || req.password.is_none() {
-            result.error = Some("username and password required when sasl enabled".to_string());
-            error!("kafka ping fail: sasl enabled but missing credentials");
-            return Err((StatusCode::BAD_REQUEST, Json(result)));
-        }
-
-        let username = req.username.clone().unwrap();
-        let password = req.password.unwrap();
-
-        result.username = Some(username.clone());
-        result.security_protocol = Some(req.security_protocol.clone());
-        result.mechanism = Some(req.mechanism.clone());
-
-        let sasl_config = SaslConfig {
-            mechanism: req.mechanism.clone(),
-            username,
-            password,
-            security_protocol: req.security_protocol.clone(),
+        let sasl_config = match SaslConfig::from_credentials(
+            &req.mechanism,
+            req.username.clone(),
+            req.password.clone(),
+            &req.security_protocol,
+        ) {
+            Ok(sasl_config) => sasl_config,
+            Err(e) => {
+                error!("kafka ping fail: invalid sasl config, {}", e);
+                result.error = Some(e);
+                return Err((StatusCode::BAD_REQUEST, Json(result)));
+            }
         };
+
+        result.username = Some(sasl_config.username.clone());
+        result.security_protocol = Some(sasl_config.security_protocol.clone());
+        result.mechanism = Some(sasl_config.mechanism.clone());
         config = config.with_sasl(sasl_config);
     }
 
-    // 创建 producer
+    // 每个请求单独创建 producer：配置来自调用方，放入进程级共享缓存会随不同请求无限增长
     let producer = match KafkaProducer::new(&config) {
         Ok(p) => p,
         Err(e) => {
@@ -146,10 +149,24 @@ async fn ping_kafka(
         }
     };
 
-    // Ping
-    match producer.ping(Duration::from_secs(req.timeout)) {
-        Ok(_) => {
+    // Ping：一次 metadata 请求同时完成连通性检查与 metadata 获取，指定 topic 时只请求该 topic。
+    // metadata 请求是阻塞调用，放到阻塞线程池中与各 broker 的 TCP 探测并发进行
+    let timeout = Duration::from_secs(req.timeout);
+    let topics: Vec<String> = req.topic.iter().cloned().collect();
+    let metadata = tokio::task::spawn_blocking(move || {
+        let topics: Vec<&str> = topics.iter().map(String::as_str).collect();
+        producer.describe_cluster(&topics, timeout)
+    });
+    let (probes, metadata) = tokio::join!(probe_brokers(&req.brokers, timeout), metadata);
+    result.broker_probes = probes;
+
+    match metadata.map_err(|e| e.to_string()).and_then(|r| r) {
+        Ok(cluster) => {
             result.success = true;
+            result.cluster_name = Some(cluster.orig_broker_name);
+            result.broker_count = Some(cluster.broker_count);
+            result.topic_count = Some(cluster.topic_count);
+            result.partition_count = cluster.topics.first().map(|info| info.partitions);
         }
         Err(e) => {
             result.error = Some(format!("ping fail: {e}"));
@@ -158,57 +175,10 @@ async fn ping_kafka(
         }
     }
 
-    // 获取 metadata
-    if let Some(topic) = &req.topic {
-        match producer.get_topic_metadata(topic, Duration::from_secs(req.timeout)) {
-            Ok(metadata) => {
-                parse_metadata(&metadata, &mut result);
-            }
-            Err(e) => {
-                error!("fetch topic metadata fail: {}", e);
-            }
-        }
-    } else {
-        match producer.get_topic_metadata("", Duration::from_secs(req.timeout)) {
-            Ok(metadata) => {
-                parse_metadata(&metadata, &mut result);
-            }
-            Err(e) => {
-                error!("fetch cluster metadata fail: {}", e);
-            }
-        }
-    }
-
     info!("kafka ping success: cluster={:?}", result.cluster_name);
     Ok(Json(result))
 }
 
-fn parse_metadata(metadata: &str, result: &mut PingResponse) {
-    if let Some(cluster_line) = metadata.lines().next()
-        && let Some(cluster) = cluster_line.strip_prefix("Cluster: ")
-    {
-        result.cluster_name = Some(cluster.to_string());
-    }
-    if let Some(brokers_line) = metadata.lines().nth(1)
-        && let Some(count_str) = brokers_line.strip_prefix("Brokers: ")
-    {
-        result.broker_count = count_str.parse().ok();
-    }
-    if let Some(topics_line) = metadata.lines().nth(2)
-        && let Some(count_str) = topics_line.strip_prefix("Topics: ")
-    {
-        result.topic_count = count_str.parse().ok();
-    }
-    for line in metadata.lines() {
-        if line.contains("partitions")
-            && let Some(parts) = line.split(':').nth(1)
-            && let Some(count_str) = parts.split_whitespace().next()
-        {
-            result.partition_count = count_str.parse().ok();
-        }
-    }
-}
-
 pub fn create_routes() -> Router {
     Router::new()
         .route("/health", get(health_check))
@@ -0,0 +1,336 @@
+//! rc kafka 本地守护进程
+//!
+//! `rc kafka daemon` 在 Unix socket 上常驻，持有进程内共享的 Kafka 客户端。其他 rc kafka
+//! 命令优先把请求转发给守护进程，复用已完成 TCP 与 SASL 握手的 broker 连接和已缓存的
+//! metadata；守护进程不可用时回退到进程内执行。
+//!
+//! 协议为每行一个 JSON 请求、每行一个 JSON 响应。请求中携带完整的客户端配置（含 SASL 凭据），
+//! 因此 socket 放在当前用户独占的 0700 专用目录中（不与 topic 缓存共用），且双方都只与相同 uid 的对端通信：
+//! 服务端拒绝其他用户的连接，客户端在发送请求前校验 socket 文件与对端进程的属主。
+
+use serde::{Deserialize, Serialize};
+use std::fs;
+use std::io;
+use std::os::unix::fs::{DirBuilderExt, FileTypeExt, MetadataExt, PermissionsExt};
+use std::path::{Path, PathBuf};
+use std::time::Duration;
+use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
+use tokio::net::{UnixListener, UnixStream};
+use util::client::kafka::{
+    ClusterMetadataInfo, KafkaClientConfig, KafkaProducer, TopicMetadataInfo,
+};
+
+/// 守护进程请求
+#[derive(Debug, Serialize, Deserialize)]
+#[serde(tag = "op", rename_all = "snake_case")]
+pub enum DaemonRequest {
+    /// 获取集群 metadata 摘要及指定 topic 的信息
+    DescribeCluster {
+        config: KafkaClientConfig,
+        topics: Vec<String>,
+        timeout: u64,
+    },
+    /// 列出所有 topic
+    ListTopics {
+        config: KafkaClientConfig,
+        timeout: u64,
+    },
+}
+
+/// 守护进程响应
+#[derive(Debug, PartialEq, Eq, Serialize, Deserialize)]
+#[serde(rename_all = "snake_case")]
+pub enum DaemonResponse {
+    Cluster(ClusterMetadataInfo),
+    Topics(Vec<TopicMetadataInfo>),
+    Error(String),
+}
+
+/// 默认 socket 路径
+///
+/// 优先使用 `RC_KAFKA_SOCKET`，其次为 `$XDG_RUNTIME_DIR/rc-kafka/kafka.sock`，最后为
+/// `$HOME/.cache/rc-kafka/kafka.sock`。不回退到共享的临时目录，两者都未设置时返回 None
+pub fn socket_path() -> Option<PathBuf> {
+    if let Some(path) = std::env::var_os("RC_KAFKA_SOCKET") {
+        return Some(PathBuf::from(path));
+    }
+    std::env::var_os("XDG_RUNTIME_DIR")
+        .map(PathBuf::from)
+        .or_else(|| std::env::var_os("HOME").map(|home| PathBuf::from(home).join(".cache")))
+        .map(|dir| dir.join("rc-kafka").join("kafka.sock"))
+}
+
+/// 当前进程的有效 uid
+///
+/// 通过 socketpair 读取对端凭据获得，对端即本进程，无需额外依赖
+fn current_uid() -> io::Result<u32> {
+    let (stream, _peer) = UnixStream::pair()?;
+    Ok(stream.peer_cred()?.uid())
+}
+
+/// 向守护进程发送请求
+///
+/// socket 不存在、不属于当前用户或对端进程不是当前用户时返回 None，调用方应回退到进程内执行；
+/// 已把请求交给守护进程但未在超时内拿到响应时返回错误，不再重复执行一遍
+pub async fn call(
+    path: &Path,
+    request: &DaemonRequest,
+    timeout: Duration,
+) -> Option<Result<DaemonResponse, String>> {
+    let uid = current_uid().ok()?;
+    let metadata = fs::metadata(path).ok()?;
+    if !metadata.file_type().is_socket() || metadata.uid() != uid {
+        return None;
+    }
+
+    let stream = tokio::time::timeout(timeout, UnixStream::connect(path))
+        .await
+        .ok()?
+        .ok()?;
+    if stream.peer_cred().ok()?.uid() != uid {
+        return None;
+    }
+
+    let mut line = serde_json::to_vec(request).ok()?;
+    line.push(b'\n');
+
+    let exchange = async {
+        let (reader, mut writer) = stream.into_split();
+        writer.write_all(&line).await?;
+        let mut response = String::new();
+        BufReader::new(reader).read_line(&mut response).await?;
+        serde_json::from_str::<DaemonResponse>(&response).map_err(io::Error::from)
+    };
+
+    Some(match tokio::time::timeout(timeout, exchange).await {
+        Ok(Ok(response)) => Ok(response),
+        Ok(Err(e)) => Err(format!("Failed to talk to rc kafka daemon: {e}")),
+        Err(_) => Err(format!(
+            "rc kafka daemon did not respond within {}s",
+            timeout.as_secs()
+        )),
+    })
+}
+
+/// 启动守护进程，持续处理请求
+pub async fn serve(path: &Path) -> anyhow::Result<()> {
+    let listener = bind(path).await?;
+    let uid = current_uid()?;
+
+    loop {
+        let (stream, _) = listener.accept().await?;
+        match stream.peer_cred() {
+            Ok(cred) if cred.uid() == uid => {}
+            _ => continue,
+        }
+        tokio::spawn(async move {
+            let _ = handle_connection(stream).await;
+        });
+    }
+}
+
+/// 在当前用户独占的目录中创建监听 socket
+///
+/// 目录已存在时不会被 `DirBuilder::mode` 修正，因此创建后再校验属主与权限，
+/// 目录属于其他用户或对组、其他用户开放时拒绝启动。socket 在 `bind` 与 `set_permissions`
+/// 之间短暂按 umask 创建，由 0700 目录保证此窗口内其他用户无法访问
+async fn bind(path: &Path) -> anyhow::Result<UnixListener> {
+    let dir = path
+        .parent()
+        .filter(|dir| !dir.as_os_str().is_empty())
+        .unwrap_or(Path::new("."));
+    fs::DirBuilder::new()
+        .recursive(true)
+        .mode(0o700)
+        .create(dir)?;
+
+    let metadata = fs::metadata(dir)?;
+    if metadata.uid() != current_uid()? || metadata.mode() & 0o077 != 0 {
+        return Err(anyhow::anyhow!(
+            "{} must be a directory owned by the current user with mode 0700",
+            dir.display()
+        ));
+    }
+
+    if let Ok(metadata) = fs::symlink_metadata(path) {
+        if !metadata.file_type().is_socket() {
+            return Err(anyhow::anyhow!(
+                "{} exists and is not a socket, refusing to replace it",
+                path.display()
+            ));
+        }
+        if UnixStream::connect(path).await.is_ok() {
+            return Err(anyhow::anyhow!(
+                "rc kafka daemon already running on {}",
+                path.display()
+            ));
+        }
+        // 上次异常退出遗留的 socket 文件
+        fs::remove_file(path)?;
+    }
+
+    let listener = UnixListener::bind(path)?;
+    fs::set_permissions(path, fs::Permissions::from_mode(0o600))?;
+    Ok(listener)
+}
+
+/// 处理单个连接上的请求，每行一个请求
+async fn handle_connection(stream: UnixStream) -> io::Result<()> {
+    let (reader, mut writer) = stream.into_split();
+    let mut lines = BufReader::new(reader).lines();
+
+    while let Some(line) = lines.next_line().await? {
+        let response = match serde_json::from_str::<DaemonRequest>(&line) {
+            // rdkafka 的 metadata 请求是阻塞调用，放到阻塞线程池执行
+            Ok(request) => tokio::task::spawn_blocking(move || execute(request))
+                .await
+                .unwrap_or_else(|e| DaemonResponse::Error(e.to_string())),
+            Err(e) => DaemonResponse::Error(format!("Invalid request: {e}")),
+        };
+
+        let mut out = serde_json::to_vec(&response)?;
+        out.push(b'\n');
+        writer.write_all(&out).await?;
+    }
+
+    Ok(())
+}
+
+/// 使用进程内共享的客户端执行请求
+///
+/// 请求失败时把对应客户端移出共享缓存，避免失效的客户端常驻守护进程
+fn execute(request: DaemonRequest) -> DaemonResponse {
+    let (config, result) = match request {
+        DaemonRequest::DescribeCluster {
+            config,
+            topics,
+            timeout,
+        } => {
+            let names: Vec<&str> = topics.iter().map(String::as_str).collect();
+            let result = KafkaProducer::get_shared(&config)
+                .and_then(|producer| {
+                    producer.describe_cluster(&names, Duration::from_secs(timeout))
+                })
+                .map(DaemonResponse::Cluster);
+            (config, result)
+        }
+        DaemonRequest::ListTopics { config, timeout } => {
+            let result = KafkaProducer::get_shared(&config)
+                .and_then(|producer| producer.list_topics(Duration::from_secs(timeout)))
+                .map(DaemonResponse::Topics);
+            (config, result)
+        }
+    };
+
+    result.unwrap_or_else(|e| {
+        KafkaProducer::evict_shared(&config);
+        DaemonResponse::Error(e)
+    })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn test_dir(name: &str) -> PathBuf {
+        std::env::temp_dir().join(format!("rc-kafka-daemon-{}-{}", name, std::process::id()))
+    }
+
+    #[test]
+    fn test_protocol_round_trip() {
+        let request = DaemonRequest::DescribeCluster {
+            config: KafkaClientConfig::new(vec!["localhost:9092".to_string()], "test-client"),
+            topics: vec!["orders".to_string()],
+            timeout: 5,
+        };
+        let line = serde_json::to_string(&request).unwrap();
+        assert!(line.starts_with(r#"{"op":"describe_cluster""#));
+        match serde_json::from_str::<DaemonRequest>(&line).unwrap() {
+            DaemonRequest::DescribeCluster {
+                config,
+                topics,
+                timeout,
+            } => {
+                assert_eq!(config.brokers, vec!["localhost:9092".to_string()]);
+                assert_eq!(topics, vec!["orders".to_string()]);
+                assert_eq!(timeout, 5);
+            }
+            other => panic!("unexpected request: {other:?}"),
+        }
+
+        let response = DaemonResponse::Topics(vec![TopicMetadataInfo {
+            name: "orders".to_string(),
+            partitions: 3,
+        }]);
+        let line = serde_json::to_string(&response).unwrap();
+        assert_eq!(
+            serde_json::from_str::<DaemonResponse>(&line).unwrap(),
+            response
+        );
+    }
+
+    #[test]
+    fn test_execute_maps_client_error() {
+        // 超出 librdkafka 允许范围的缓冲区大小，创建客户端时即失败，不会访问网络
+        let config = KafkaClientConfig::new(vec!["localhost:9092".to_string()], "test-client")
+            .with_socket_buffers(u32::MAX, u32::MAX);
+
+        let response = execute(DaemonRequest::ListTopics { config, timeout: 1 });
+        assert!(matches!(response, DaemonResponse::Error(e) if e.contains("Failed to create")));
+    }
+
+    #[tokio::test]
+    async fn test_call_skips_non_socket() {
+        let dir = test_dir("call");
+        fs::create_dir_all(&dir).unwrap();
+        let path = dir.join("kafka.sock");
+        fs::write(&path, b"not a socket").unwrap();
+
+        let request = DaemonRequest::ListTopics {
+            config: KafkaClientConfig::new(vec!["localhost:9092".to_string()], "test-client"),
+            timeout: 1,
+        };
+        assert!(
+            call(&path, &request, Duration::from_secs(1))
+                .await
+                .is_none()
+        );
+        assert!(
+            call(&dir.join("missing.sock"), &request, Duration::from_secs(1))
+                .await
+                .is_none()
+        );
+
+        let _ = fs::remove_dir_all(&dir);
+    }
+
+    #[tokio::test]
+    async fn test_bind_refuses_to_replace_regular_file() {
+        let dir = test_dir("bind");
+        fs::DirBuilder::new().mode(0o700).create(&dir).unwrap();
+        let path = dir.join("kafka.sock");
+        fs::write(&path, b"keep me").unwrap();
+
+        assert!(bind(&path).await.is_err());
+        assert_eq!(fs::read(&path).unwrap(), b"keep me");
+
+        let _ = fs::remove_dir_all(&dir);
+    }
+
+    #[tokio::test]
+    async fn test_bind_checks_directory_permissions() {
+        let dir = test_dir("perms");
+        fs::create_dir_all(&dir).unwrap();
+        fs::set_permissions(&dir, fs::Permissions::from_mode(0o755)).unwrap();
+        let path = dir.join("kafka.sock");
+
+        assert!(bind(&path).await.is_err());
+        assert!(fs::symlink_metadata(&path).is_err());
+
+        fs::set_permissions(&dir, fs::Permissions::from_mode(0o700)).unwrap();
+        let _listener = bind(&path).await.unwrap();
+        assert_eq!(fs::metadata(&path).unwrap().mode() & 0o777, 0o600);
+
+        let _ = fs::remove_dir_all(&dir);
+    }
+}
@@ -1,7 +1,18 @@
+mod kafka_daemon;
+mod topic_cache;
+
 use clap::{Args, Parser, Subcommand};
+use kafka_daemon::{DaemonRequest, DaemonResponse};
 use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
+use std::fmt::Write as _;
+use std::io::{self, Write};
+use std::path::{Path, PathBuf};
 use std::time::Duration;
-use util::client::kafka::{KafkaClientConfig, KafkaProducer, SaslConfig};
+use util::client::kafka::{
+    BrokerProbe, ClusterMetadataInfo, KafkaAdmin, KafkaClientConfig, KafkaProducer, SaslConfig,
+    TopicMetadataInfo, TopicOperationResult, TopicSpec, probe_brokers,
+};
 use util::client::mysql::{MySqlClient, MySqlClientConfig};
 use util::client::redis::{RedisClient, RedisClientConfig, RedisPingResult};
 
@@ -25,6 +36,10 @@ enum Commands {
 
 #[derive(Args)]
 struct KafkaArgs {
+    /// Suppress progress messages and only print results
+    #[arg(short, long, global = true)]
+    quiet: bool,
+
     #[command(subcommand)]
     command: KafkaCommands,
 }
@@ -33,10 +48,19 @@ struct KafkaArgs {
 enum KafkaCommands {
     /// Ping Kafka cluster to check connectivity
     Ping(PingArgs),
+    /// List topics in Kafka cluster
+    Topics(KafkaTopicsArgs),
+    /// Create topics in one batched request
+    CreateTopics(KafkaCreateTopicsArgs),
+    /// Delete topics in one batched request
+    DeleteTopics(KafkaDeleteTopicsArgs),
+    /// Run a local daemon that keeps Kafka connections open for other rc commands
+    Daemon(KafkaDaemonArgs),
 }
 
+/// Kafka 连接参数，各 kafka 子命令共用
 #[derive(Args)]
-struct PingArgs {
+struct KafkaConnArgs {
     /// Kafka broker addresses (comma-separated)
     #[arg(short, long, value_delimiter = ',', required = true)]
     brokers: Vec<String>,
@@ -65,15 +89,115 @@ struct PingArgs {
     #[arg(long, default_value = "SASL_PLAINTEXT")]
     security_protocol: String,
 
-    /// SASL mechanism (PLAIN, SCRAM-SHA-256, SCRAM-SHA-512)
-    #[arg(long, default_value = "PLAIN")]
+    /// SASL mechanism (PLAIN, SCRAM-SHA-256, SCRAM-SHA-512, case-insensitive)
+    #[arg(long, default_value = "PLAIN", value_parser = parse_sasl_mechanism)]
     mechanism: String,
 
+    /// Socket receive buffer size in bytes (default: kernel autotuning)
+    #[arg(long)]
+    socket_receive_buffer: Option<u32>,
+
+    /// Socket send buffer size in bytes (default: kernel autotuning)
+    #[arg(long)]
+    socket_send_buffer: Option<u32>,
+
+    /// Do not use a running rc kafka daemon, always connect in-process
+    #[arg(long)]
+    no_daemon: bool,
+}
+
+#[derive(Args)]
+struct KafkaDaemonArgs {
+    /// Unix socket path, its directory must be 0700 (default: $RC_KAFKA_SOCKET,
+    /// $XDG_RUNTIME_DIR/rc-kafka/kafka.sock, then ~/.cache/rc-kafka/kafka.sock)
+    #[arg(long)]
+    socket: Option<PathBuf>,
+}
+
+#[derive(Args)]
+struct PingArgs {
+    #[command(flatten)]
+    conn: KafkaConnArgs,
+
     /// Topic to check metadata (optional)
     #[arg(short, long)]
     topic: Option<String>,
 
-    /// Output format (text or json)
+    /// Topics to check metadata in one batched request (comma-separated, optional)
+    #[arg(long, value_delimiter = ',', conflicts_with = "topic")]
+    topics: Vec<String>,
+
+    /// Output format (text, json or jsonl)
+    #[arg(long, default_value = "text")]
+    format: String,
+}
+
+#[derive(Args)]
+struct KafkaTopicsArgs {
+    #[command(flatten)]
+    conn: KafkaConnArgs,
+
+    /// Keep broker order instead of sorting topics by name
+    #[arg(long)]
+    no_sort: bool,
+
+    /// Seconds a locally cached topic list stays fresh
+    #[arg(long, default_value = "30")]
+    cache_ttl: u64,
+
+    /// Do not read or write the local topic cache
+    #[arg(long)]
+    no_cache: bool,
+
+    /// Ignore the cached topic list and refresh it from the cluster
+    #[arg(long)]
+    refresh: bool,
+
+    /// Output format (text, json or jsonl)
+    #[arg(long, default_value = "text")]
+    format: String,
+}
+
+#[derive(Args)]
+struct KafkaCreateTopicsArgs {
+    #[command(flatten)]
+    conn: KafkaConnArgs,
+
+    /// Topics to create (comma-separated)
+    #[arg(long, value_delimiter = ',', required_unless_present = "topics_file")]
+    topics: Vec<String>,
+
+    /// File with one topic per line: name[,partitions[,replication_factor]]
+    #[arg(long)]
+    topics_file: Option<PathBuf>,
+
+    /// Default partition count
+    #[arg(long, default_value = "1")]
+    partitions: i32,
+
+    /// Default replication factor
+    #[arg(long, default_value = "1")]
+    replication_factor: i32,
+
+    /// Output format (text, json or jsonl)
+    #[arg(long, default_value = "text")]
+    format: String,
+}
+
+#[derive(Args)]
+struct KafkaDeleteTopicsArgs {
+    #[command(flatten)]
+    conn: KafkaConnArgs,
+
+    /// Topics to delete (comma-separated)
+    #[arg(long, value_delimiter = ',', required_unless_present = "topics_file")]
+    topics: Vec<String>,
+
+    /// File with one topic name per line
+    #[arg(long)]
+    topics_file: Option<PathBuf>,
+
+    /// Output format (text, json or jsonl)
     #[arg(long, default_value = "text")]
     format: String,
 }
@@ -380,6 +504,7 @@ struct MySqlQueryArgs {
 
 #[derive(Debug, Serialize, Deserialize)]
 struct PingResult {
+    op: String,
     success: bool,
     brokers: Vec<String>,
     client_id: String,
@@ -401,6 +526,10 @@ struct PingResult {
     #[serde(skip_serializing_if = "Option::is_none")]
     partition_count: Option<usize>,
     #[serde(skip_serializing_if = "Option::is_none")]
+    topics_metadata: Option<Vec<TopicMetadataInfo>>,
+    #[serde(skip_serializing_if = "Vec::is_empty")]
+    broker_probes: Vec<BrokerProbe>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     error: Option<String>,
 }
 
@@ -417,17 +546,24 @@ struct MySqlPingResult {
     error: Option<String>,
 }
 
-#[tokio::main]
-async fn main() -> anyhow::Result<()> {
+fn main() -> anyhow::Result<()> {
+    // 先解析参数再创建 runtime，--help 与参数错误直接退出，不必启动 tokio
     let cli = Cli::parse();
 
-    match cli.command {
-        Commands::Kafka(kafka_args) => handle_kafka_command(kafka_args).await?,
-        Commands::MySql(mysql_args) => handle_mysql_command(mysql_args).await?,
-        Commands::Redis(redis_args) => handle_redis_command(redis_args).await?,
-    }
+    // 每次只执行一条命令，单线程 runtime 即可，省去创建工作线程池的开销
+    let runtime = tokio::runtime::Builder::new_current_thread()
+        .enable_all()
+        .build()?;
 
-    Ok(())
+    runtime.block_on(async {
+        match cli.command {
+            Commands::Kafka(kafka_args) => handle_kafka_command(kafka_args).await?,
+            Commands::MySql(mysql_args) => handle_mysql_command(mysql_args).await?,
+            Commands::Redis(redis_args) => handle_redis_command(redis_args).await?,
+        }
+
+        Ok::<(), anyhow::Error>(())
+    })
 }
 
 async fn handle_mysql_command(args: MySqlArgs) -> anyhow::Result<()> {
@@ -440,32 +576,184 @@ async fn handle_mysql_command(args: MySqlArgs) -> anyhow::Result<()> {
 
 async fn handle_kafka_command(args: KafkaArgs) -> anyhow::Result<()> {
     match args.command {
-        KafkaCommands::Ping(ping_args) => handle_ping(ping_args).await?,
+        KafkaCommands::Ping(ping_args) => handle_ping(ping_args, args.quiet).await?,
+        KafkaCommands::Topics(topics_args) => handle_kafka_topics(topics_args).await?,
+        KafkaCommands::CreateTopics(create_args) => handle_kafka_create_topics(create_args).await?,
+        KafkaCommands::DeleteTopics(delete_args) => handle_kafka_delete_topics(delete_args).await?,
+        KafkaCommands::Daemon(daemon_args) => handle_kafka_daemon(daemon_args, args.quiet).await?,
     }
     Ok(())
 }
 
-async fn handle_ping(args: PingArgs) -> anyhow::Result<()> {
-    let is_json = args.format.to_lowercase() == "json";
-    let brokers = args.brokers.clone();
-    let client_id = args.client_id.clone();
-    let sasl_enabled = args.sasl;
+/// 是否为 JSON 类输出格式：json 为缩进格式，jsonl 为每次操作一行的紧凑格式
+fn is_json_format(format: &str) -> bool {
+    matches!(format, "json" | "jsonl")
+}
 
-    if !is_json {
-        println!("🔌 Connecting to Kafka cluster...");
-        println!("   Brokers: {}", args.brokers.join(", "));
-        println!("   Client ID: {}", args.client_id);
+/// 按输出格式打印 JSON，jsonl 输出单行紧凑 JSON，便于脚本逐行解析
+fn print_json<T: Serialize>(value: &T, format: &str) -> anyhow::Result<()> {
+    let line = if format == "jsonl" {
+        serde_json::to_string(value)?
+    } else {
+        serde_json::to_string_pretty(value)?
+    };
+    println!("{}", line);
+    Ok(())
+}
+
+/// 解析 --mechanism，忽略大小写并规范化为 librdkafka 接受的名称
+fn parse_sasl_mechanism(mechanism: &str) -> Result<String, String> {
+    SaslConfig::normalize_mechanism(mechanism).map(str::to_string)
+}
+
+/// 输出整个请求失败时的错误，JSON 类格式输出 `{"op": ..., "error": ...}` 对象
+fn print_kafka_error(op: &str, error: &str, format: &str) -> anyhow::Result<()> {
+    if is_json_format(format) {
+        print_json(&serde_json::json!({"op": op, "error": error}), format)
+    } else {
+        println!("❌ Error: {}", error);
+        Ok(())
+    }
+}
+
+/// 根据命令行连接参数构建 Kafka 客户端配置
+fn build_kafka_config(conn: &KafkaConnArgs) -> anyhow::Result<KafkaClientConfig> {
+    let mut config = KafkaClientConfig::new(conn.brokers.clone(), conn.client_id.clone())
+        .with_timeout(conn.timeout);
+    // 只在显式指定时设置，否则保留内核的缓冲区自动调节
+    config.socket_receive_buffer_bytes = conn.socket_receive_buffer;
+    config.socket_send_buffer_bytes = conn.socket_send_buffer;
+
+    if conn.sasl {
+        let sasl = SaslConfig::from_credentials(
+            &conn.mechanism,
+            conn.username.clone(),
+            conn.password.clone(),
+            &conn.security_protocol,
+        )
+        .map_err(|e| anyhow::anyhow!(e))?;
+        config = config.with_sasl(sasl);
     }
 
+    Ok(config)
+}
+
+/// 连接信息横幅，整体拼接后一次输出
+fn kafka_banner(conn: &KafkaConnArgs, sasl: Option<&SaslConfig>) -> String {
+    let mut banner = format!(
+        "🔌 Connecting to Kafka cluster...\n   Brokers: {}\n   Client ID: {}\n",
+        conn.brokers.join(", "),
+        conn.client_id
+    );
+    if let Some(sasl) = sasl {
+        let _ = write!(
+            banner,
+            "   SASL: Enabled\n   Username: {}\n   Security Protocol: {}\n   Mechanism: {}\n",
+            sasl.username, sasl.security_protocol, sasl.mechanism
+        );
+    }
+    banner
+}
+
+/// 守护进程请求的等待时间，在 Kafka 超时之上留出少量余量
+fn daemon_timeout(conn: &KafkaConnArgs) -> Duration {
+    Duration::from_secs(conn.timeout + 1)
+}
+
+/// 把请求交给 rc kafka daemon
+///
+/// 未使用 --no-daemon 且找到属于当前用户的守护进程时返回其结果，否则返回 None 由调用方进程内执行
+async fn call_daemon(
+    conn: &KafkaConnArgs,
+    request: DaemonRequest,
+) -> Option<Result<DaemonResponse, String>> {
+    if conn.no_daemon {
+        return None;
+    }
+    let path = kafka_daemon::socket_path()?;
+    kafka_daemon::call(&path, &request, daemon_timeout(conn)).await
+}
+
+/// 获取集群 metadata：优先交给 rc kafka daemon 复用已建立的连接，不可用时在进程内执行
+async fn describe_cluster(
+    conn: &KafkaConnArgs,
+    config: &KafkaClientConfig,
+    topics: Vec<String>,
+) -> Result<ClusterMetadataInfo, String> {
+    let request = DaemonRequest::DescribeCluster {
+        config: config.clone(),
+        topics: topics.clone(),
+        timeout: conn.timeout,
+    };
+    match call_daemon(conn, request).await {
+        Some(Ok(DaemonResponse::Cluster(cluster))) => return Ok(cluster),
+        Some(Ok(DaemonResponse::Error(e))) | Some(Err(e)) => return Err(e),
+        Some(Ok(_)) => return Err("Unexpected response from rc kafka daemon".to_string()),
+        None => {}
+    }
+
+    // metadata 请求是阻塞调用，放到阻塞线程池执行，不占用 runtime 线程
+    let config = config.clone();
+    let timeout = Duration::from_secs(conn.timeout);
+    tokio::task::spawn_blocking(move || {
+        let names: Vec<&str> = topics.iter().map(String::as_str).collect();
+        KafkaProducer::get_shared(&config)?.describe_cluster(&names, timeout)
+    })
+    .await
+    .map_err(|e| e.to_string())?
+}
+
+/// 列出所有 topic：优先交给 rc kafka daemon，不可用时在进程内执行
+async fn list_topics(
+    conn: &KafkaConnArgs,
+    config: &KafkaClientConfig,
+) -> Result<Vec<TopicMetadataInfo>, String> {
+    let request = DaemonRequest::ListTopics {
+        config: config.clone(),
+        timeout: conn.timeout,
+    };
+    match call_daemon(conn, request).await {
+        Some(Ok(DaemonResponse::Topics(topics))) => return Ok(topics),
+        Some(Ok(DaemonResponse::Error(e))) | Some(Err(e)) => return Err(e),
+        Some(Ok(_)) => return Err("Unexpected response from rc kafka daemon".to_string()),
+        None => {}
+    }
+
+    let config = config.clone();
+    let timeout = Duration::from_secs(conn.timeout);
+    tokio::task::spawn_blocking(move || KafkaProducer::get_shared(&config)?.list_topics(timeout))
+        .await
+        .map_err(|e| e.to_string())?
+}
+
+/// 格式化 broker 探测结果，每个 broker 一行
+fn format_broker_probes(probes: &[BrokerProbe]) -> String {
+    let mut buf = String::new();
+    for probe in probes {
+        let _ = match (&probe.error, probe.latency_ms) {
+            (None, Some(ms)) => writeln!(buf, "  Broker {}: reachable ({} ms)", probe.broker, ms),
+            (Some(e), _) => writeln!(buf, "  Broker {}: unreachable ({})", probe.broker, e),
+            _ => writeln!(buf, "  Broker {}: reachable", probe.broker),
+        };
+    }
+    buf
+}
+
+async fn handle_ping(args: PingArgs, quiet: bool) -> anyhow::Result<()> {
+    let format = args.format.to_lowercase();
+    let is_json = is_json_format(&format);
+    // 进度信息仅在交互式文本输出时打印，--quiet 时连格式化都跳过
+    let show_progress = !is_json && !quiet;
+
     // 创建配置
-    let mut config =
-        KafkaClientConfig::new(args.brokers, args.client_id).with_timeout(args.timeout);
+    let config = build_kafka_config(&args.conn)?;
 
     let mut result = PingResult {
+        op: "ping".to_string(),
         success: false,
-        brokers: brokers.clone(),
-        client_id: client_id.clone(),
-        sasl_enabled,
+        brokers: args.conn.brokers.clone(),
+        client_id: args.conn.client_id.clone(),
+        sasl_enabled: args.conn.sasl,
         username: None,
         security_protocol: None,
         mechanism: None,
@@ -474,147 +762,337 @@ async fn handle_ping(args: PingArgs) -> anyhow::Result<()> {
         topic_count: None,
         topic: args.topic.clone(),
         partition_count: None,
+        topics_metadata: None,
+        broker_probes: Vec::new(),
         error: None,
     };
 
-    // 如果启用 SASL，添加认证配置
-    if args.sasl {
-        let username = args
-            .username
-            .ok_or_else(|| anyhow::anyhow!("Username is required when SASL is enabled"))?;
-        let password = args
-            .password
-            .ok_or_else(|| anyhow::anyhow!("Password is required when SASL is enabled"))?;
-
-        result.username = Some(username.clone());
-        result.security_protocol = Some(args.security_protocol.clone());
-        result.mechanism = Some(args.mechanism.clone());
-
-        if !is_json {
-            println!("   SASL: Enabled");
-            println!("   Username: {}", username);
-            println!("   Security Protocol: {}", args.security_protocol);
-            println!("   Mechanism: {}", args.mechanism);
-        }
+    // 如果启用 SASL，记录认证配置
+    if let Some(sasl) = &config.sasl_config {
+        result.username = Some(sasl.username.clone());
+        result.security_protocol = Some(sasl.security_protocol.clone());
+        result.mechanism = Some(sasl.mechanism.clone());
+    }
 
-        let sasl_config = SaslConfig {
-            mechanism: args.mechanism,
-            username,
-            password,
-            security_protocol: args.security_protocol,
-        };
-        config = config.with_sasl(sasl_config);
+    if show_progress {
+        print!("{}", kafka_banner(&args.conn, config.sasl_config.as_ref()));
     }
 
-    // 创建生产者
-    let producer = match KafkaProducer::new(&config) {
-        Ok(p) => p,
-        Err(e) => {
-            result.error = Some(format!("Failed to create Kafka producer: {}", e));
-            if is_json {
-                println!("{}", serde_json::to_string_pretty(&result)?);
-            } else {
-                println!("❌ Error: {}", result.error.as_ref().unwrap());
-            }
-            return Err(anyhow::anyhow!("Failed to create producer"));
-        }
-    };
+    // 执行 ping：一次 metadata 请求同时完成连通性检查与 metadata 获取。
+    // 指定单个 topic 时只请求该 topic，避免在大集群上拉取全量 topic 列表
+    let names: Vec<String> = args
+        .topic
+        .iter()
+        .chain(args.topics.iter())
+        .cloned()
+        .collect();
 
-    // 执行 ping
-    if !is_json {
+    if show_progress {
         println!("\n⏳ Pinging Kafka cluster...");
     }
 
-    match producer.ping(Duration::from_secs(args.timeout)) {
-        Ok(_) => {
+    // metadata 请求与各 broker 的 TCP 探测并发进行，总耗时取两者较慢者而不是逐个累加
+    let (probes, metadata) = tokio::join!(
+        probe_brokers(&args.conn.brokers, Duration::from_secs(args.conn.timeout)),
+        describe_cluster(&args.conn, &config, names.clone())
+    );
+    result.broker_probes = probes;
+    let probe_summary = format_broker_probes(&result.broker_probes);
+
+    let cluster = match metadata {
+        Ok(cluster) => {
             result.success = true;
             if !is_json {
                 println!("✅ Ping successful!\n");
             }
+            cluster
         }
         Err(e) => {
             result.error = Some(format!("Ping failed: {}", e));
             if is_json {
-                println!("{}", serde_json::to_string_pretty(&result)?);
+                print_json(&result, &format)?;
             } else {
-                println!("❌ Ping failed: {}", e);
+                println!("❌ Ping failed: {}\n{}", e, probe_summary);
             }
             return Err(anyhow::anyhow!("Ping failed"));
         }
-    }
+    };
+
+    let by_name: HashMap<&str, &TopicMetadataInfo> = cluster
+        .topics
+        .iter()
+        .map(|topic| (topic.name.as_str(), topic))
+        .collect();
 
-    // 如果指定了 topic，获取 topic metadata
+    result.cluster_name = Some(cluster.orig_broker_name.clone());
+    result.broker_count = Some(cluster.broker_count);
+    result.topic_count = Some(cluster.topic_count);
     if let Some(topic) = &args.topic {
-        if !is_json {
-            println!("📊 Fetching metadata for topic '{}'...", topic);
-        }
-        match producer.get_topic_metadata(topic, Duration::from_secs(args.timeout)) {
-            Ok(metadata) => {
-                // 解析 metadata 字符串
-                parse_metadata(&metadata, &mut result);
-                if !is_json {
-                    println!("\n{}", metadata);
-                }
-            }
-            Err(e) => {
-                if !is_json {
-                    println!("⚠️  Failed to fetch topic metadata: {}", e);
-                }
-            }
+        result.partition_count = by_name.get(topic.as_str()).map(|info| info.partitions);
+    }
+    if !args.topics.is_empty() {
+        result.topics_metadata = Some(
+            args.topics
+                .iter()
+                .filter_map(|name| by_name.get(name.as_str()).map(|info| (*info).clone()))
+                .collect(),
+        );
+    }
+
+    if !is_json {
+        let mut buf = format!(
+            "Cluster: {}\nBrokers: {}\nTopics: {}\n",
+            cluster.orig_broker_name, cluster.broker_count, cluster.topic_count
+        );
+        for name in &names {
+            let _ = match by_name.get(name.as_str()) {
+                Some(info) => writeln!(buf, "  Topic '{}': {} partitions", name, info.partitions),
+                None => writeln!(buf, "  Topic '{}': not found", name),
+            };
         }
+        buf.push_str(&probe_summary);
+        println!("{}", buf);
+    }
+
+    // 输出 JSON 结果
+    if is_json {
+        print_json(&result, &format)?;
+    }
+
+    Ok(())
+}
+
+async fn handle_kafka_topics(args: KafkaTopicsArgs) -> anyhow::Result<()> {
+    let format = args.format.to_lowercase();
+    let is_json = is_json_format(&format);
+    let config = build_kafka_config(&args.conn)?;
+
+    let cache_file = if args.no_cache {
+        None
     } else {
-        // 获取集群整体 metadata
-        if !is_json {
-            println!("📊 Fetching cluster metadata...");
-        }
-        match producer.get_topic_metadata("", Duration::from_secs(args.timeout)) {
-            Ok(metadata) => {
-                parse_metadata(&metadata, &mut result);
-                if !is_json {
-                    println!("\n{}", metadata);
-                }
-            }
-            Err(_) => {
-                if !is_json {
-                    println!("   Use --topic <name> to get specific topic metadata\n");
+        topic_cache::cache_path(&args.conn.brokers, config.sasl_config.as_ref())
+    };
+    let cached = match &cache_file {
+        Some(path) if !args.refresh => topic_cache::load(path, Duration::from_secs(args.cache_ttl)),
+        _ => None,
+    };
+
+    let mut topics = match cached {
+        Some(topics) => topics,
+        None => {
+            let topics = match list_topics(&args.conn, &config).await {
+                Ok(topics) => topics,
+                Err(e) => {
+                    print_kafka_error("topics", &e, &format)?;
+                    return Err(anyhow::anyhow!(e));
                 }
+            };
+            // 缓存写入失败不影响本次结果
+            if let Some(path) = &cache_file {
+                let _ = topic_cache::store(path, &topics);
             }
+            topics
         }
+    };
+
+    if !args.no_sort {
+        topics.sort_unstable_by(|a, b| a.name.cmp(&b.name));
     }
 
-    // 输出 JSON 结果
     if is_json {
-        println!("{}", serde_json::to_string_pretty(&result)?);
+        print_json(
+            &serde_json::json!({"op": "topics", "count": topics.len(), "topics": topics}),
+            &format,
+        )?;
+        return Ok(());
     }
 
+    // 拼接为一个缓冲区后一次写出，避免逐行 println 带来的大量 write 系统调用
+    let mut buf = format!("Topics: {}\n", topics.len());
+    for (i, topic) in topics.iter().enumerate() {
+        let _ = writeln!(
+            buf,
+            "{:3}. {} ({} partitions)",
+            i + 1,
+            topic.name,
+            topic.partitions
+        );
+    }
+    io::stdout().lock().write_all(buf.as_bytes())?;
+
     Ok(())
 }
 
-fn parse_metadata(metadata: &str, result: &mut PingResult) {
-    if let Some(cluster_line) = metadata.lines().next() {
-        if let Some(cluster) = cluster_line.strip_prefix("Cluster: ") {
-            result.cluster_name = Some(cluster.to_string());
+/// 合并命令行与文件中的 topic 条目，文件中忽略空行和 # 开头的注释
+fn collect_topic_entries(
+    topics: &[String],
+    topics_file: Option<&Path>,
+) -> anyhow::Result<Vec<String>> {
+    let mut entries: Vec<String> = topics
+        .iter()
+        .map(|t| t.trim().to_string())
+        .filter(|t| !t.is_empty())
+        .collect();
+    if let Some(path) = topics_file {
+        let content = std::fs::read_to_string(path)
+            .map_err(|e| anyhow::anyhow!("Failed to read {}: {}", path.display(), e))?;
+        for (i, line) in content.lines().enumerate() {
+            let line = line.trim();
+            if line.is_empty() || line.starts_with('#') {
+                continue;
+            }
+            if topic_name(line).is_empty() {
+                return Err(anyhow::anyhow!(
+                    "Empty topic name at {}:{}: '{}'",
+                    path.display(),
+                    i + 1,
+                    line
+                ));
+            }
+            entries.push(line.to_string());
         }
     }
-    if let Some(brokers_line) = metadata.lines().nth(1) {
-        if let Some(count_str) = brokers_line.strip_prefix("Brokers: ") {
-            result.broker_count = count_str.parse().ok();
-        }
+    if entries.is_empty() {
+        return Err(anyhow::anyhow!("No topics given"));
     }
-    if let Some(topics_line) = metadata.lines().nth(2) {
-        if let Some(count_str) = topics_line.strip_prefix("Topics: ") {
-            result.topic_count = count_str.parse().ok();
+    Ok(entries)
+}
+
+/// topic 条目中的名称部分（第一个逗号之前）
+fn topic_name(entry: &str) -> &str {
+    entry.split(',').next().unwrap_or_default().trim()
+}
+
+/// 解析只允许包含 topic 名称的条目，用于 delete-topics
+fn parse_topic_name(entry: &str) -> anyhow::Result<&str> {
+    if entry.contains(',') {
+        return Err(anyhow::anyhow!(
+            "Unexpected fields in topic entry '{}', expected a topic name only",
+            entry
+        ));
+    }
+    Ok(topic_name(entry))
+}
+
+/// 解析 topic 条目：name[,partitions[,replication_factor]]
+fn parse_topic_spec(
+    entry: &str,
+    partitions: i32,
+    replication_factor: i32,
+) -> anyhow::Result<TopicSpec> {
+    let mut parts = entry.split(',').map(str::trim);
+    let name = parts.next().unwrap_or_default();
+    if name.is_empty() {
+        return Err(anyhow::anyhow!("Empty topic name in entry '{}'", entry));
+    }
+    let partitions = match parts.next() {
+        Some(value) => value
+            .parse()
+            .map_err(|_| anyhow::anyhow!("Invalid partitions for topic '{}': {}", name, value))?,
+        None => partitions,
+    };
+    let replication_factor = match parts.next() {
+        Some(value) => value.parse().map_err(|_| {
+            anyhow::anyhow!("Invalid replication factor for topic '{}': {}", name, value)
+        })?,
+        None => replication_factor,
+    };
+    if parts.next().is_some() {
+        return Err(anyhow::anyhow!(
+            "Too many fields in topic entry '{}', expected name[,partitions[,replication_factor]]",
+            entry
+        ));
+    }
+    Ok(TopicSpec::new(name, partitions, replication_factor))
+}
+
+/// 输出批量 topic 操作结果，有任一 topic 失败时返回错误
+fn print_topic_results(
+    op: &str,
+    results: &[TopicOperationResult],
+    format: &str,
+) -> anyhow::Result<()> {
+    let failed = results.iter().filter(|r| !r.success).count();
+
+    if is_json_format(format) {
+        print_json(&serde_json::json!({"op": op, "results": results}), format)?;
+    } else {
+        let mut buf = String::new();
+        for result in results {
+            let _ = match &result.error {
+                None => writeln!(buf, "✅ Topic '{}' {}", result.name, op),
+                Some(e) => writeln!(buf, "❌ Topic '{}': {}", result.name, e),
+            };
         }
+        print!("{}", buf);
     }
-    for line in metadata.lines() {
-        if line.contains("partitions") {
-            if let Some(parts) = line.split(':').nth(1) {
-                if let Some(count_str) = parts.trim().split_whitespace().next() {
-                    result.partition_count = count_str.parse().ok();
-                }
-            }
+
+    if failed > 0 {
+        return Err(anyhow::anyhow!(
+            "{} of {} topics failed",
+            failed,
+            results.len()
+        ));
+    }
+    Ok(())
+}
+
+async fn handle_kafka_create_topics(args: KafkaCreateTopicsArgs) -> anyhow::Result<()> {
+    let format = args.format.to_lowercase();
+    let specs = collect_topic_entries(&args.topics, args.topics_file.as_deref())?
+        .iter()
+        .map(|entry| parse_topic_spec(entry, args.partitions, args.replication_factor))
+        .collect::<anyhow::Result<Vec<_>>>()?;
+
+    let config = build_kafka_config(&args.conn)?;
+    let results = match KafkaAdmin::new(&config) {
+        Ok(admin) => admin.create_topics(&specs).await,
+        Err(e) => Err(e),
+    };
+    let results = match results {
+        Ok(results) => results,
+        Err(e) => {
+            print_kafka_error("created", &e, &format)?;
+            return Err(anyhow::anyhow!(e));
         }
+    };
+
+    print_topic_results("created", &results, &format)
+}
+
+async fn handle_kafka_delete_topics(args: KafkaDeleteTopicsArgs) -> anyhow::Result<()> {
+    let format = args.format.to_lowercase();
+    let entries = collect_topic_entries(&args.topics, args.topics_file.as_deref())?;
+    let names = entries
+        .iter()
+        .map(|entry| parse_topic_name(entry))
+        .collect::<anyhow::Result<Vec<_>>>()?;
+
+    let config = build_kafka_config(&args.conn)?;
+    let results = match KafkaAdmin::new(&config) {
+        Ok(admin) => admin.delete_topics(&names).await,
+        Err(e) => Err(e),
+    };
+    let results = match results {
+        Ok(results) => results,
+        Err(e) => {
+            print_kafka_error("deleted", &e, &format)?;
+            return Err(anyhow::anyhow!(e));
+        }
+    };
+
+    print_topic_results("deleted", &results, &format)
+}
+
+async fn handle_kafka_daemon(args: KafkaDaemonArgs, quiet: bool) -> anyhow::Result<()> {
+    let path = args
+        .socket
+        .or_else(kafka_daemon::socket_path)
+        .ok_or_else(|| anyhow::anyhow!("Cannot determine socket path, pass --socket"))?;
+    if !quiet {
+        println!("🛰  rc kafka daemon listening on {}", path.display());
     }
+    kafka_daemon::serve(&path).await
 }
 
 async fn handle_redis_command(args: RedisArgs) -> anyhow::Result<()> {
@@ -646,6 +1124,18 @@ fn build_redis_config(
     config
 }
 
+/// Redis 连接信息横幅，整体拼接后一次输出
+fn redis_banner(host: &str, db: i64, tls: bool) -> String {
+    let mut banner = format!(
+        "🔌 Connecting to Redis...\n   Host: {}\n   Database: {}\n",
+        host, db
+    );
+    if tls {
+        banner.push_str("   TLS: Enabled\n");
+    }
+    banner
+}
+
 async fn handle_redis_ping(args: RedisPingArgs) -> anyhow::Result<()> {
     let is_json = args.format.to_lowercase() == "json";
     let config = build_redis_config(
@@ -666,12 +1156,7 @@ async fn handle_redis_ping(args: RedisPingArgs) -> anyhow::Result<()> {
     };
 
     if !is_json {
-        println!("🔌 Connecting to Redis...");
-        println!("   Host: {}", args.host);
-        println!("   Database: {}", args.db);
-        if args.tls {
-            println!("   TLS: Enabled");
-        }
+        print!("{}", redis_banner(&args.host, args.db, args.tls));
     }
 
     let mut client = match RedisClient::new(&config).await {
@@ -925,9 +1410,12 @@ async fn handle_redis_keys(args: RedisKeysArgs) -> anyhow::Result<()> {
                 if keys.is_empty() {
                     println!("(empty list)");
                 } else {
+                    // 拼接后一次写出，避免 key 较多时逐行 println
+                    let mut buf = String::new();
                     for (i, key) in keys.iter().enumerate() {
-                        println!("{}) \"{}\"", i + 1, key);
+                        let _ = writeln!(buf, "{}) \"{}\"", i + 1, key);
                     }
+                    print!("{}", buf);
                 }
             }
         }
@@ -944,19 +1432,27 @@ async fn handle_redis_keys(args: RedisKeysArgs) -> anyhow::Result<()> {
     Ok(())
 }
 
+/// MySQL 连接信息横幅，整体拼接后一次输出
+fn mysql_banner(host: &str, database: Option<&str>, tls: bool) -> String {
+    let mut banner = format!("🔌 Connecting to MySQL...\n   Host: {}\n", host);
+    if let Some(db) = database {
+        let _ = writeln!(banner, "   Database: {}", db);
+    }
+    if tls {
+        banner.push_str("   TLS: Enabled\n");
+    }
+    banner
+}
+
 async fn handle_mysql_ping(args: MySqlPingArgs) -> anyhow::Result<()> {
     let is_json = args.format.to_lowercase() == "json";
     let host = args.host.clone();
 
     if !is_json {
-        println!("🔌 Connecting to MySQL...");
-        println!("   Host: {}", args.host);
-        if let Some(db) = &args.database {
-            println!("   Database: {}", db);
-        }
-        if args.ssl {
-            println!("   TLS: Enabled");
-        }
+        print!(
+            "{}",
+            mysql_banner(&args.host, args.database.as_deref(), args.ssl)
+        );
     }
 
     let mut config = MySqlClientConfig::new(&args.host).with_timeout(args.timeout);
@@ -1047,15 +1543,11 @@ async fn handle_mysql_query(args: MySqlQueryArgs) -> anyhow::Result<()> {
     let _host = args.host.clone();
 
     if !is_json {
-        println!("🔌 Connecting to MySQL...");
-        println!("   Host: {}", args.host);
-        if let Some(db) = &args.database {
-            println!("   Database: {}", db);
-        }
-        if args.ssl {
-            println!("   TLS: Enabled");
-        }
-        println!("   Query: {}", args.query);
+        println!(
+            "{}   Query: {}",
+            mysql_banner(&args.host, args.database.as_deref(), args.ssl),
+            args.query
+        );
     }
 
     let mut config = MySqlClientConfig::new(&args.host).with_timeout(args.timeout);
@@ -1138,3 +1630,62 @@ async fn handle_mysql_query(args: MySqlQueryArgs) -> anyhow::Result<()> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_parse_topic_spec() {
+        let spec = parse_topic_spec("orders", 3, 2).unwrap();
+        assert_eq!(
+            (spec.name.as_str(), spec.partitions, spec.replication_factor),
+            ("orders", 3, 2)
+        );
+
+        let spec = parse_topic_spec(" payments , 6 , 3 ", 1, 1).unwrap();
+        assert_eq!(
+            (spec.name.as_str(), spec.partitions, spec.replication_factor),
+            ("payments", 6, 3)
+        );
+
+        let spec = parse_topic_spec("events,12", 1, 2).unwrap();
+        assert_eq!((spec.partitions, spec.replication_factor), (12, 2));
+
+        assert!(parse_topic_spec("orders,three", 1, 1).is_err());
+        assert!(parse_topic_spec("orders,3,x", 1, 1).is_err());
+        assert!(parse_topic_spec(",3", 1, 1).is_err());
+        assert!(parse_topic_spec("orders,1,1,junk", 1, 1).is_err());
+    }
+
+    #[test]
+    fn test_parse_topic_name() {
+        assert_eq!(parse_topic_name("orders").unwrap(), "orders");
+        assert!(parse_topic_name("orders,3").is_err());
+    }
+
+    #[test]
+    fn test_collect_topic_entries() {
+        let path = std::env::temp_dir().join(format!("rc-topics-{}.txt", std::process::id()));
+        std::fs::write(&path, "# comment\n\n  orders,3  \npayments\n").unwrap();
+
+        let entries = collect_topic_entries(&[" events ".to_string(), String::new()], Some(&path));
+        assert_eq!(
+            entries.unwrap(),
+            vec![
+                "events".to_string(),
+                "orders,3".to_string(),
+                "payments".to_string()
+            ]
+        );
+
+        std::fs::write(&path, "orders\n,3\n").unwrap();
+        let err = collect_topic_entries(&[], Some(&path)).unwrap_err();
+        assert!(err.to_string().contains(":2:"));
+
+        std::fs::write(&path, "# only comments\n").unwrap();
+        assert!(collect_topic_entries(&[], Some(&path)).is_err());
+
+        let _ = std::fs::remove_file(&path);
+    }
+}
@@ -0,0 +1,148 @@
+//! Kafka topic 列表的本地缓存
+//!
+//! 脚本中短时间内重复执行 `rc kafka topics` 时直接读取本地文件，避免每次都向 broker
+//! 拉取全量 metadata。缓存按文件 mtime 判断是否过期，写入时先写临时文件再 rename，
+//! 保证并发读取的进程不会读到写了一半的文件。
+//!
+//! 缓存文件名包含完整凭据（含 SASL 机制与密码）的带密钥摘要，密码错误时不会命中其他凭据
+//! 写入的缓存；密钥随机生成并以 0600 保存在缓存目录中，文件名无法用于离线猜测密码。
+
+use std::collections::hash_map::{DefaultHasher, RandomState};
+use std::fs;
+use std::hash::{BuildHasher, Hash, Hasher};
+use std::io::{self, Read, Write};
+use std::os::unix::fs::{DirBuilderExt, OpenOptionsExt};
+use std::path::{Path, PathBuf};
+use std::time::Duration;
+use util::client::kafka::{SaslConfig, TopicMetadataInfo};
+
+/// 缓存文件路径
+///
+/// 位于 `$XDG_CACHE_HOME/rc`（未设置时为 `$HOME/.cache/rc`）下，缓存目录不可用时返回 None
+pub fn cache_path(brokers: &[String], sasl: Option<&SaslConfig>) -> Option<PathBuf> {
+    let dir = std::env::var_os("XDG_CACHE_HOME")
+        .map(PathBuf::from)
+        .or_else(|| std::env::var_os("HOME").map(|home| PathBuf::from(home).join(".cache")))?
+        .join("rc");
+
+    cache_file(&dir, brokers, sasl).ok()
+}
+
+/// 缓存目录下的缓存文件，按集群地址与完整凭据的带密钥摘要命名
+///
+/// 不同集群、不同用户或不同密码互不影响
+fn cache_file(dir: &Path, brokers: &[String], sasl: Option<&SaslConfig>) -> io::Result<PathBuf> {
+    let key = cache_key(dir)?;
+
+    let mut hasher = DefaultHasher::new();
+    key.hash(&mut hasher);
+    brokers.hash(&mut hasher);
+    sasl.map(|sasl| {
+        (
+            &sasl.security_protocol,
+            &sasl.mechanism,
+            &sasl.username,
+            &sasl.password,
+        )
+    })
+    .hash(&mut hasher);
+    Ok(dir.join(format!("kafka-topics-{:016x}.json", hasher.finish())))
+}
+
+/// 读取缓存目录中的摘要密钥，不存在时随机生成并以 0600 写入
+fn cache_key(dir: &Path) -> io::Result<[u8; 16]> {
+    let path = dir.join("kafka-topics.key");
+    let mut key = [0u8; 16];
+
+    match fs::File::open(&path) {
+        Ok(mut file) => file.read_exact(&mut key)?,
+        Err(e) if e.kind() == io::ErrorKind::NotFound => {
+            fs::DirBuilder::new()
+                .recursive(true)
+                .mode(0o700)
+                .create(dir)?;
+            let random = RandomState::new();
+            key[..8].copy_from_slice(&random.hash_one(0u8).to_le_bytes());
+            key[8..].copy_from_slice(&random.hash_one(1u8).to_le_bytes());
+
+            let created = fs::OpenOptions::new()
+                .write(true)
+                .create_new(true)
+                .mode(0o600)
+                .open(&path);
+            match created {
+                Ok(mut file) => file.write_all(&key)?,
+                // 其他进程同时生成了密钥，改用已写入的密钥
+                Err(e) if e.kind() == io::ErrorKind::AlreadyExists => {
+                    fs::File::open(&path)?.read_exact(&mut key)?
+                }
+                Err(e) => return Err(e),
+            }
+        }
+        Err(e) => return Err(e),
+    }
+
+    Ok(key)
+}
+
+/// 读取未过期的缓存，缓存不存在、已过期或无法解析时返回 None
+pub fn load(path: &Path, ttl: Duration) -> Option<Vec<TopicMetadataInfo>> {
+    let modified = fs::metadata(path).ok()?.modified().ok()?;
+    if modified.elapsed().ok()? > ttl {
+        return None;
+    }
+
+    let content = fs::read(path).ok()?;
+    serde_json::from_slice(&content).ok()
+}
+
+/// 原子写入缓存
+pub fn store(path: &Path, topics: &[TopicMetadataInfo]) -> io::Result<()> {
+    if let Some(dir) = path.parent() {
+        fs::create_dir_all(dir)?;
+    }
+
+    let tmp = path.with_extension(format!("json.{}.tmp", std::process::id()));
+    fs::write(&tmp, serde_json::to_vec(topics)?)?;
+    fs::rename(&tmp, path)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_store_and_load() {
+        let path = std::env::temp_dir()
+            .join(format!("rc-topic-cache-{}", std::process::id()))
+            .join("kafka-topics-test.json");
+        let topics = vec![TopicMetadataInfo {
+            name: "orders".to_string(),
+            partitions: 3,
+        }];
+
+        store(&path, &topics).expect("store cache");
+
+        assert_eq!(load(&path, Duration::from_secs(30)), Some(topics));
+        assert_eq!(load(&path, Duration::ZERO), None);
+
+        let _ = fs::remove_dir_all(path.parent().unwrap());
+    }
+
+    #[test]
+    fn test_cache_file_differs_by_credentials() {
+        let dir = std::env::temp_dir().join(format!("rc-topic-cache-key-{}", std::process::id()));
+        let brokers = vec!["localhost:9092".to_string()];
+        let sasl = SaslConfig::plaintext("user1", "secret-password");
+        let wrong = SaslConfig::plaintext("user1", "wrong-password");
+
+        let plain = cache_file(&dir, &brokers, None).unwrap();
+        let first = cache_file(&dir, &brokers, Some(&sasl)).unwrap();
+
+        assert_ne!(plain, first);
+        assert_eq!(first, cache_file(&dir, &brokers, Some(&sasl)).unwrap());
+        assert_ne!(first, cache_file(&dir, &brokers, Some(&wrong)).unwrap());
+
+        let _ = fs::remove_dir_all(&dir);
+    }
+}
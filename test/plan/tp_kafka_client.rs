@@ -2,7 +2,8 @@ use rdkafka::message::Message;
 use serde::{Deserialize, Serialize};
 use std::time::Duration;
 use util::client::kafka::{
-    KafkaClientConfig, KafkaConsumer, KafkaProducer, extract_json, extract_payload,
+    KafkaAdmin, KafkaClientConfig, KafkaConsumer, KafkaProducer, TopicSpec, extract_json,
+    extract_payload,
 };
 
 const TEST_KAFKA_BROKERS: &str = "test-kafka.bkbase-test.svc.cluster.local:9092";
@@ -363,6 +364,40 @@ async fn test_consumer_ping() {
     }
 }
 
+/// 测试批量创建和删除 topic
+#[tokio::test]
+#[ignore]
+async fn test_admin_batch_create_delete_topics() {
+    let config = KafkaClientConfig::new(vec![TEST_KAFKA_BROKERS.to_string()], "test-admin-client")
+        .with_sasl_plaintext(USERNAME, PASSWORD)
+        .with_timeout(10);
+
+    let admin = KafkaAdmin::new(&config).expect("Failed to create admin client");
+    let names = ["rc_batch_topic_1", "rc_batch_topic_2", "rc_batch_topic_3"];
+    let specs: Vec<TopicSpec> = names
+        .iter()
+        .map(|name| TopicSpec::new(*name, 1, 1))
+        .collect();
+
+    let created = admin
+        .create_topics(&specs)
+        .await
+        .expect("Failed to create topics");
+    assert_eq!(created.len(), names.len());
+    for result in &created {
+        println!("  create {}: {:?}", result.name, result.error);
+    }
+
+    let deleted = admin
+        .delete_topics(&names)
+        .await
+        .expect("Failed to delete topics");
+    assert_eq!(deleted.len(), names.len());
+    assert!(deleted.iter().all(|result| result.success));
+
+    println!("✓ Batch created and deleted {} topics", names.len());
+}
+
 /// 测试连接失败时的 ping 行为
 #[tokio::test]
 async fn test_ping_with_invalid_broker() {